@@ -0,0 +1,59 @@
+"""Speed and accuracy of every activation in neural.activations.
+
+Run with ``python -m benchmarks.activations``. Each activation is applied in
+place to ``--size`` values drawn from N(0, 4**2); the table shows time per
+call, throughput and the worst absolute error against the exact function on
+a dense grid over [-40, 40], next to the documented ``max_error`` bound. The
+first row is the overflow-free ``0.5 * (1 + tanh(x / 2))`` for reference.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from neural.activations import ACTIVATIONS, Sigmoid
+
+
+class _TanhSigmoid(Sigmoid):
+    name = "0.5(1+tanh(x/2))"
+
+    def forward(self, x, out=None):
+        out = np.multiply(x, 0.5, out=out)
+        np.tanh(out, out=out)
+        np.add(out, 1, out=out)
+        return np.multiply(out, 0.5, out=out)
+
+
+def time_per_call(activation, x, repeats):
+    out = np.empty_like(x)
+    activation.forward(x, out=out)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        activation.forward(x, out=out)
+    return (time.perf_counter() - start) / repeats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--dtype", type=str, default="float64")
+    args = parser.parse_args(argv)
+
+    x = (np.random.RandomState(0).standard_normal(args.size) * 4).astype(args.dtype)
+    grid = np.linspace(-40, 40, 2000001)
+    exact = {"sigmoid": 1 / (1 + np.exp(-grid)), "tanh": np.tanh(grid), "relu": np.maximum(grid, 0)}
+
+    print("%-16s %10s %12s %12s %12s" % ("activation", "ms/call", "Mvalues/s", "max error", "bound"))
+    activations = [_TanhSigmoid()] + [cls() for cls in ACTIVATIONS.values()]
+    with np.errstate(over="ignore"):
+        for activation in activations:
+            seconds = time_per_call(activation, x, args.repeats)
+            reference = exact["sigmoid"] if isinstance(activation, Sigmoid) else exact[activation.name]
+            error = np.abs(activation.forward(grid.astype(args.dtype)) - reference).max()
+            print("%-16s %10.3f %12.1f %12.2e %12.2e" % (
+                activation.name, seconds * 1000, args.size / seconds / 1e6, error, activation.max_error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Memory and throughput of bit-packed binary inputs against dense arrays.
+
+Run with ``python -m benchmarks.binary``. The same random 0/1 dataset is
+held as int64, float64 and PackedBinary; the table shows the bytes each
+takes and the training and ``think`` throughput of each.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from neural.binary import PackedBinary
+from neural.network import NeuralNetwork
+
+
+def rows_per_second(function, rows, repeats):
+    function()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return rows * repeats / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--hidden", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = np.random.RandomState(0)
+    dense = (rng.random_sample((args.rows, args.width)) < 0.5).astype(np.int64)
+    outputs = dense[:, :1] ^ dense[:, 1:2]
+    layer_sizes = (args.width, args.hidden, 1)
+    representations = (
+        ("int64", dense),
+        ("float64", dense.astype(np.float64)),
+        ("packed", PackedBinary.from_dense(dense)),
+    )
+
+    print("%-8s %12s %14s %14s" % ("inputs", "MB", "train rows/s", "think rows/s"))
+    for name, inputs in representations:
+        network = NeuralNetwork(layer_sizes)
+        train = rows_per_second(lambda: network.train(inputs, outputs, 1), args.rows, args.repeats)
+        think = rows_per_second(lambda: network.think(inputs), args.rows, args.repeats)
+        print("%-8s %12.2f %14.0f %14.0f" % (name, inputs.nbytes / 2 ** 20, train, think))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Train a seed/learning-rate sweep one network at a time and as one Ensemble.
+
+Run with ``python -m benchmarks.ensemble``. Both paths train the same
+configurations from the same starting weights; the table shows wall-clock
+time for each and the largest weight difference between them.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from neural.ensemble import Ensemble
+from neural.network import NeuralNetwork
+from neural.optimizers import SGD
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=str, default="3,4,1", help="layer sizes, comma separated")
+    parser.add_argument("--models", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    layer_sizes = tuple(int(n) for n in args.layers.split(","))
+    inputs = np.array([[0, 0, 1], [0, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=float)
+    outputs = np.array([[0, 1, 1, 0]], dtype=float).T
+    if layer_sizes[0] != inputs.shape[1]:
+        raise SystemExit("the sweep uses the 3-input XOR set, the first layer must be 3 wide")
+    seeds = list(range(args.models))
+    learning_rates = np.linspace(0.1, 2.0, args.models)
+
+    start = time.perf_counter()
+    networks = []
+    for seed, learning_rate in zip(seeds, learning_rates):
+        network = NeuralNetwork(layer_sizes, seed=seed, optimizer=SGD(learning_rate))
+        network.train(inputs, outputs, args.iterations)
+        networks.append(network)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ensemble = Ensemble(layer_sizes, seeds, learning_rates)
+    ensemble.train(inputs, outputs, args.iterations)
+    batched = time.perf_counter() - start
+
+    difference = max(
+        np.abs(ensemble.synaptic_weights[layer][k] - network.synaptic_weights[layer]).max()
+        for k, network in enumerate(networks)
+        for layer in range(len(layer_sizes) - 1)
+    )
+    print("%d models x %d iterations" % (args.models, args.iterations))
+    print("one at a time: %8.3f s" % sequential)
+    print("ensemble:      %8.3f s  (%.1fx)" % (batched, sequential / batched))
+    print("max weight difference: %.3g" % difference)
+
+
+if __name__ == "__main__":
+    main()
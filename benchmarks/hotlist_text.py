@@ -0,0 +1,108 @@
+"""Text handling in the hotlist pipeline: per-stage recomputation against shared views.
+
+Run with ``python -m benchmarks.hotlist_text``. ``--items`` synthetic items
+(English and Chinese titles and summaries, with punctuation) go through the
+text work of the keyword filter, exact dedup and the summarizer twice: once
+the old way, where every stage normalizes and tokenizes again with the old
+``str.replace`` loop, and once through ``text_view``, where each item's
+text is normalized and tokenized once. Both must produce the same results.
+"""
+import argparse
+import random
+import re
+import time
+
+from tools.ai_hotlist.text import PUNCT, STOP_WORDS, clear_views, text_view
+
+
+def legacy_normalize_text(text):
+    text = (text or "").strip().lower()
+    text = re.sub(r"\s+", " ", text)
+    for ch in PUNCT:
+        text = text.replace(ch, " ")
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def legacy_simple_keywords(text, top_k=5):
+    tokens = re.split(r"[^\w]+", (text or "").lower())
+    stop = set(STOP_WORDS)
+    counts = {}
+    for t in tokens:
+        if not t or len(t) <= 1:
+            continue
+        if t in stop:
+            continue
+        if any(ch.isdigit() for ch in t) and not any(ch.isalpha() for ch in t):
+            continue
+        counts[t] = counts.get(t, 0) + 1
+    return [w for w, _ in sorted(counts.items(), key=lambda x: (-x[1], x[0]))[:top_k]]
+
+
+def legacy(items, allow):
+    passed, keys, keywords = 0, set(), []
+    for it in items:
+        t = legacy_normalize_text(f"{it['title']} {it['summary']}")
+        passed += any(a.lower() in t for a in allow)
+        keys.add(legacy_normalize_text(it["title"]))
+        keywords.append(legacy_simple_keywords(f"{it['title']} {it['summary']}", top_k=3))
+        keywords.append(legacy_simple_keywords(it["title"], top_k=3))
+    return passed, len(keys), keywords
+
+
+def shared(items, allow):
+    passed, keys, keywords = 0, set(), []
+    for it in items:
+        t = text_view(it).norm
+        passed += any(a in t for a in allow)
+    for it in items:
+        keys.add(text_view(it).title_norm)
+    for it in items:
+        view = text_view(it)
+        keywords.append(view.keywords(top_k=3))
+        keywords.append(view.title_keywords(top_k=3))
+    return passed, len(keys), keywords
+
+
+def synthetic_items(n, seed=0):
+    rng = random.Random(seed)
+    english = ["large", "language", "model", "agents", "diffusion", "vision", "benchmark", "reasoning",
+               "open-source", "LLM", "RAG", "fine-tuning", "GPT-5", "transformer", "data", "v2"]
+    chinese = ["大模型", "开源", "推理", "智能体", "多模态", "发布", "评测", "数据集", "量子位", "训练"]
+    punct = [",", ".", "!", "?", ":", "，", "。", "！", "（", "）", "——", " - ", "\n"]
+    items = []
+    for _ in range(n):
+        vocab = chinese if rng.random() < 0.3 else english
+        title = " ".join(rng.choice(vocab) + rng.choice(["", "", rng.choice(punct)]) for _ in range(rng.randint(4, 10)))
+        summary = " ".join(rng.choice(vocab) + rng.choice(["", "", rng.choice(punct)]) for _ in range(rng.randint(20, 60)))
+        items.append({"title": title, "summary": summary})
+    return items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    items = synthetic_items(args.items)
+    allow = ["llm", "agents", "开源", "多模态"]
+
+    start = time.perf_counter()
+    expected = legacy(items, allow)
+    legacy_seconds = time.perf_counter() - start
+
+    clear_views()
+    start = time.perf_counter()
+    actual = shared(items, allow)
+    shared_seconds = time.perf_counter() - start
+    if actual != expected:
+        raise SystemExit("shared text views changed the results")
+
+    print("%-14s %10s %14s" % ("pipeline", "seconds", "items/s"))
+    print("%-14s %10.3f %14.0f" % ("per stage", legacy_seconds, args.items / legacy_seconds))
+    print("%-14s %10.3f %14.0f" % ("shared views", shared_seconds, args.items / shared_seconds))
+    print("speedup: %.1fx" % (legacy_seconds / shared_seconds))
+
+
+if __name__ == "__main__":
+    main()
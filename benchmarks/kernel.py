@@ -0,0 +1,88 @@
+"""Compare NeuralNetwork.train against the preallocated TrainingKernel.
+
+Run with ``python -m benchmarks.kernel``. For each dtype it prints the
+training throughput and the peak temporary memory a single step allocates,
+as seen by tracemalloc (NumPy reports its array buffers there).
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from neural.kernel import TrainingKernel
+from neural.network import NeuralNetwork
+
+
+def make_dataset(rows, width, seed=0):
+    rng = np.random.RandomState(seed)
+    inputs = (rng.random_sample((rows, width)) < 0.5).astype(np.float64)
+    outputs = inputs[:, :1].copy()
+    return inputs, outputs
+
+
+def _step_reference(network, inputs, outputs):
+    adjustments, _ = network.adjustments(inputs, outputs)
+    for weights, adjustment in zip(network.synaptic_weights, adjustments):
+        weights += adjustment
+
+
+def temp_bytes_per_step(step):
+    step()  # warm up so lazily created objects are not counted
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - before
+
+
+def steps_per_second(step, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        step()
+    return iterations / (time.perf_counter() - start)
+
+
+def bench(layer_sizes, rows, iterations, dtype):
+    inputs, outputs = make_dataset(rows, layer_sizes[0])
+    # The reference path receives inputs already in the network dtype so
+    # only the per-step temporaries are measured.
+    cast_inputs = inputs.astype(dtype)
+    cast_outputs = outputs.astype(dtype)
+
+    reference = NeuralNetwork(layer_sizes, dtype=dtype)
+    kernel = TrainingKernel(NeuralNetwork(layer_sizes, dtype=dtype), rows)
+    kernel.load(inputs, outputs)
+
+    def reference_step():
+        _step_reference(reference, cast_inputs, cast_outputs)
+
+    results = []
+    for name, step in (("train", reference_step), ("kernel", kernel.step)):
+        results.append({
+            "mode": name,
+            "dtype": np.dtype(dtype).name,
+            "temp_bytes_per_step": temp_bytes_per_step(step),
+            "steps_per_sec": steps_per_second(step, iterations),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=str, default="256,64,1", help="layer sizes, comma separated")
+    parser.add_argument("--rows", type=int, default=2048)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    layer_sizes = tuple(int(n) for n in args.layers.split(","))
+    print("%-8s %-8s %16s %12s" % ("mode", "dtype", "temp bytes/step", "steps/sec"))
+    for dtype in (np.float64, np.float32):
+        for row in bench(layer_sizes, args.rows, args.iterations, dtype):
+            print("%-8s %-8s %16d %12.1f" % (row["mode"], row["dtype"], row["temp_bytes_per_step"], row["steps_per_sec"]))
+
+
+if __name__ == "__main__":
+    main()
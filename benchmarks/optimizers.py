@@ -0,0 +1,51 @@
+"""Time-to-target-loss for each optimizer in neural.optimizers.
+
+Run with ``python -m benchmarks.optimizers``. Every optimizer trains the same
+network from the same starting weights with ``train_until`` and stops at the
+target loss, so the table shows both iterations and wall-clock time needed.
+"""
+import argparse
+
+import numpy as np
+
+from neural.network import NeuralNetwork
+from neural.optimizers import SGD, Adam, RMSProp
+
+
+def make_dataset(rows, width, seed=0):
+    # Parity of the first three bits: not linearly separable, needs a hidden layer.
+    rng = np.random.RandomState(seed)
+    inputs = (rng.random_sample((rows, width)) < 0.5).astype(np.float64)
+    outputs = (inputs[:, :3].sum(axis=1, keepdims=True) % 2)
+    return inputs, outputs
+
+
+OPTIMIZERS = {
+    "sgd": lambda: SGD(learning_rate=0.01),
+    "momentum": lambda: SGD(learning_rate=0.01, momentum=0.9),
+    "rmsprop": lambda: RMSProp(learning_rate=0.01),
+    "adam": lambda: Adam(learning_rate=0.01),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=str, default="8,16,1", help="layer sizes, comma separated")
+    parser.add_argument("--rows", type=int, default=256)
+    parser.add_argument("--target", type=float, default=0.01, help="target mean squared error")
+    parser.add_argument("--max-iterations", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    layer_sizes = tuple(int(n) for n in args.layers.split(","))
+    inputs, outputs = make_dataset(args.rows, layer_sizes[0])
+
+    print("%-10s %-14s %10s %10s %12s" % ("optimizer", "stop", "iterations", "seconds", "final loss"))
+    for name, factory in OPTIMIZERS.items():
+        network = NeuralNetwork(layer_sizes, optimizer=factory())
+        history = network.train_until(inputs, outputs, max_iterations=args.max_iterations, tolerance=args.target)
+        print("%-10s %-14s %10d %10.3f %12.5f" % (
+            name, history.stop_reason, history.iterations[-1], history.elapsed, history.final_loss))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Int8 quantized think against the float model.
+
+Run with ``python -m benchmarks.quantize``. A network is trained on part of a
+synthetic binary task, quantized with neural.quantize, and both models are
+evaluated on the held-out rows: weight memory, rows/sec and accuracy.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from neural.network import NeuralNetwork
+from neural.optimizers import Adam
+from neural.quantize import compare, quantize
+
+
+def rows_per_second(think, inputs, repeats):
+    think(inputs)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        think(inputs)
+    return len(inputs) * repeats / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=str, default="512,128,1", help="layer sizes, comma separated")
+    parser.add_argument("--rows", type=int, default=8000)
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    layer_sizes = tuple(int(n) for n in args.layers.split(","))
+    rng = np.random.RandomState(0)
+    inputs = (rng.random_sample((args.rows, layer_sizes[0])) < 0.5).astype(np.float64)
+    # Majority vote of the first seven inputs.
+    outputs = (inputs[:, :7].sum(axis=1, keepdims=True) > 3).astype(np.float64)
+    split = args.rows * 3 // 4
+
+    network = NeuralNetwork(layer_sizes, optimizer=Adam(learning_rate=0.01))
+    network.train(inputs[:split], outputs[:split], args.iterations)
+    quantized = quantize(network)
+
+    held_out = inputs[split:]
+    report = compare(network, quantized, held_out, outputs[split:])
+    print("%-8s %12s %14s %10s" % ("model", "weight KB", "rows/s", "accuracy"))
+    print("%-8s %12.1f %14.0f %10.4f" % (
+        "float64", report["float_bytes"] / 1024, rows_per_second(network.think, held_out, args.repeats),
+        report["float_accuracy"]))
+    print("%-8s %12.1f %14.0f %10.4f" % (
+        "int8", report["int8_bytes"] / 1024, rows_per_second(quantized.think, held_out, args.repeats),
+        report["int8_accuracy"]))
+    print("max |float - int8| output difference: %.4g (mean %.4g)" % (report["max_abs_diff"], report["mean_abs_diff"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Load-test the MicroBatcher in process.
+
+Run with ``python -m benchmarks.serving``. ``--clients`` coroutines each send
+``--requests`` single-row predictions; the batcher's latency percentiles and
+throughput are printed next to calling ``think`` once per row.
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from neural.network import NeuralNetwork
+from neural.serving import MicroBatcher
+
+
+async def load(network, rows, clients, requests, max_batch_size, max_latency):
+    batcher = MicroBatcher(network, max_batch_size=max_batch_size, max_latency=max_latency)
+    await batcher.start()
+
+    async def client(offset):
+        for i in range(requests):
+            await batcher.predict(rows[(offset + i) % len(rows)])
+
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    stats = batcher.stats()
+    await batcher.close()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=str, default="256,64,1", help="layer sizes, comma separated")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-latency-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    layer_sizes = tuple(int(n) for n in args.layers.split(","))
+    network = NeuralNetwork(layer_sizes)
+    rows = (np.random.RandomState(0).random_sample((1024, layer_sizes[0])) < 0.5).astype(float)
+
+    total = args.clients * args.requests
+    start = time.perf_counter()
+    for i in range(total):
+        network.think(rows[i % len(rows)])
+    direct = total / (time.perf_counter() - start)
+
+    stats = asyncio.run(load(network, rows, args.clients, args.requests, args.max_batch_size, args.max_latency_ms / 1000))
+    print("think per row:  %10.0f rows/sec" % direct)
+    print("micro-batched:  %10.0f rows/sec  mean batch %.1f  p50 %.2f ms  p99 %.2f ms" % (
+        stats["requests_per_sec"], stats["mean_batch_size"], stats["p50_ms"], stats["p99_ms"]))
+
+
+if __name__ == "__main__":
+    main()
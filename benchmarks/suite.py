@@ -0,0 +1,143 @@
+"""Reproducible benchmark sweep for neural.network.NeuralNetwork.
+
+Run with ``python -m benchmarks.suite`` (or ``make bench``). Every
+combination of batch size, input width, depth, dtype and iteration count
+is trained in a fresh process, so peak RSS belongs to that
+configuration alone. For each one it records training steps/sec and rows/sec,
+peak RSS, and single-row ``think`` latency percentiles.
+
+``--output`` writes the results as JSON together with the commit, Python and
+NumPy versions; ``--compare`` prints the speed ratio against an earlier file.
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+def _peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_config(config):
+    from neural.network import NeuralNetwork
+
+    width, depth, hidden = config["width"], config["depth"], config["hidden"]
+    layer_sizes = (width,) + (hidden,) * (depth - 1) + (1,)
+    rng = np.random.RandomState(0)
+    inputs = (rng.random_sample((config["batch_size"], width)) < 0.5).astype(config["dtype"])
+    outputs = inputs[:, :1].copy()
+    network = NeuralNetwork(layer_sizes, dtype=config["dtype"])
+
+    network.train(inputs, outputs, 1)
+    start = time.perf_counter()
+    network.train(inputs, outputs, config["iterations"])
+    elapsed = time.perf_counter() - start
+
+    latencies = []
+    for row in inputs[:config["think_calls"]]:
+        started = time.perf_counter()
+        network.think(row)
+        latencies.append(time.perf_counter() - started)
+
+    p50, p90, p99 = np.percentile(np.asarray(latencies) * 1e6, [50, 90, 99])
+    steps_per_sec = config["iterations"] / elapsed
+    return dict(
+        config,
+        layer_sizes=list(layer_sizes),
+        steps_per_sec=steps_per_sec,
+        rows_per_sec=steps_per_sec * config["batch_size"],
+        peak_rss_bytes=_peak_rss_bytes(),
+        think_p50_us=float(p50),
+        think_p90_us=float(p90),
+        think_p99_us=float(p99),
+    )
+
+
+def _ints(text):
+    return [int(x) for x in text.split(",")]
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def _key(result):
+    return (result["batch_size"], result["width"], result["depth"], result["dtype"], result["iterations"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-sizes", type=_ints, default=[64, 1024])
+    parser.add_argument("--widths", type=_ints, default=[16, 256])
+    parser.add_argument("--depths", type=_ints, default=[1, 3], help="number of weight layers")
+    parser.add_argument("--hidden", type=int, default=64, help="width of the hidden layers")
+    parser.add_argument("--dtypes", type=lambda s: s.split(","), default=["float64", "float32"])
+    parser.add_argument("--iterations", type=_ints, default=[200], help="training steps per configuration")
+    parser.add_argument("--think-calls", type=int, default=200)
+    parser.add_argument("--output", type=str, default=None, help="write results to this JSON file")
+    parser.add_argument("--compare", type=str, default=None, help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    configs = [
+        {
+            "batch_size": batch_size,
+            "width": width,
+            "depth": depth,
+            "hidden": args.hidden,
+            "dtype": dtype,
+            "iterations": iterations,
+            "think_calls": args.think_calls,
+        }
+        for batch_size, width, depth, dtype, iterations in itertools.product(
+            args.batch_sizes, args.widths, args.depths, args.dtypes, args.iterations
+        )
+    ]
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = {_key(r): r for r in json.load(f)["results"]}
+
+    print("%6s %6s %5s %-8s %6s %10s %12s %9s %9s %9s%s" % (
+        "batch", "width", "depth", "dtype", "iters", "steps/s", "rows/s", "rss MB", "p50 us", "p99 us",
+        "  vs base" if baseline else ""))
+    results = []
+    # One fresh process per configuration keeps peak RSS separate.
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for result in pool.imap(run_config, configs):
+            results.append(result)
+            previous = baseline.get(_key(result))
+            ratio = "  %7.2fx" % (result["steps_per_sec"] / previous["steps_per_sec"]) if previous else ""
+            print("%6d %6d %5d %-8s %6d %10.1f %12.0f %9.1f %9.1f %9.1f%s" % (
+                result["batch_size"], result["width"], result["depth"], result["dtype"], result["iterations"],
+                result["steps_per_sec"], result["rows_per_sec"], result["peak_rss_bytes"] / 2 ** 20,
+                result["think_p50_us"], result["think_p99_us"], ratio))
+
+    if args.output:
+        meta = {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
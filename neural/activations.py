@@ -0,0 +1,171 @@
+"""Activation functions for NeuralNetwork.
+
+Each activation has ``forward(x, out=None)`` and ``derivative(y, out=None)``,
+where the derivative is written in terms of the activation's *output* ``y``,
+the way backpropagation in this package uses it. Both accept ``out=`` so the
+training kernel can run them in place, including ``out=x``.
+
+``max_error`` is the largest absolute difference from the exact function
+over the whole real line (0 for the exact ones). ``python -m
+benchmarks.activations`` measures speed and error side by side. Under NumPy
+every extra pass over the array costs about as much as the transcendental it
+replaces, so of the approximations only ``hard_sigmoid`` beats the exact
+sigmoid on speed; ``sigmoid_plan`` and ``sigmoid_lut`` are there for their
+error bounds and as references for compiled kernels.
+"""
+import numpy as np
+
+
+class Activation():
+    name = None
+    max_error = 0.0
+
+    def forward(self, x, out=None):
+        raise NotImplementedError
+
+    def derivative(self, y, out=None):
+        raise NotImplementedError
+
+    def __call__(self, x, out=None):
+        return self.forward(x, out=out)
+
+
+class Sigmoid(Activation):
+    """The logistic sigmoid, ``1 / (1 + exp(-x))``, computed in place.
+
+    For large negative x ``exp(-x)`` overflows to inf and the result is
+    exactly 0, which is the correctly rounded value, so the overflow warning
+    is silenced rather than avoided. This is faster than the overflow-free
+    ``0.5 * (1 + tanh(x / 2))``, since ``exp`` is cheaper than ``tanh``.
+    """
+
+    name = "sigmoid"
+
+    def forward(self, x, out=None):
+        with np.errstate(over="ignore"):
+            out = np.negative(x, out=out)
+            np.exp(out, out=out)
+        np.add(out, 1, out=out)
+        return np.reciprocal(out, out=out)
+
+    def derivative(self, y, out=None):
+        out = np.subtract(1, y, out=out)
+        return np.multiply(out, y, out=out)
+
+
+class HardSigmoid(Sigmoid):
+    """``clip(0.2 * x + 0.5, 0, 1)``: three cheap passes, no transcendental.
+
+    Max error 0.076 (just inside |x| = 2.5). Shares the sigmoid derivative,
+    which keeps training stable where the approximation is flat.
+    """
+
+    name = "hard_sigmoid"
+    max_error = 0.076
+
+    def forward(self, x, out=None):
+        out = np.multiply(x, 0.2, out=out)
+        np.add(out, 0.5, out=out)
+        return np.clip(out, 0, 1, out=out)
+
+
+class PiecewiseSigmoid(Sigmoid):
+    """The four-segment PLAN approximation of the sigmoid.
+
+    On |x| the segments are 0.25|x| + 0.5, 0.125|x| + 0.625,
+    0.03125|x| + 0.84375 and 1; they form a concave curve, so the result is
+    simply their minimum, mirrored for negative x. Max error 0.019.
+    """
+
+    name = "sigmoid_plan"
+    max_error = 0.019
+
+    def forward(self, x, out=None):
+        magnitude = np.abs(x)
+        result = np.multiply(magnitude, 0.03125)
+        np.add(result, 0.84375, out=result)
+        np.minimum(result, 1, out=result)
+        segment = np.multiply(magnitude, 0.125)
+        np.add(segment, 0.625, out=segment)
+        np.minimum(result, segment, out=result)
+        np.multiply(magnitude, 0.25, out=segment)
+        np.add(segment, 0.5, out=segment)
+        np.minimum(result, segment, out=result)
+        # sigmoid(-x) = 1 - sigmoid(x)
+        np.subtract(result, 0.5, out=result)
+        out = np.copysign(result, x, out=out)
+        return np.add(out, 0.5, out=out)
+
+
+class LookupSigmoid(Sigmoid):
+    """Sigmoid from a table of ``size`` exact values on [-limit, limit] with linear interpolation.
+
+    Interpolation error is bounded by h**2 / 8 * max|sigmoid''| with
+    h = 2 * limit / size and max|sigmoid''| = 1 / (6 * sqrt(3)); outside the
+    table the value is clamped, which costs at most sigmoid(-limit). The
+    larger of the two is ``max_error`` (about 3.4e-4 with the defaults,
+    dominated by the clamp).
+    """
+
+    name = "sigmoid_lut"
+
+    def __init__(self, size=1024, limit=8.0):
+        self.size = size
+        self.limit = limit
+        self.scale = size / (2 * limit)
+        nodes = np.linspace(-limit, limit, size + 1)
+        self.table = Sigmoid().forward(nodes)
+        # One extra slope so the index for x == limit stays in range.
+        self.slopes = np.append(np.diff(self.table), 0.0)
+        step = 2 * limit / size
+        self.max_error = max(step ** 2 / 8 / (6 * np.sqrt(3)), 1 / (1 + np.exp(limit)))
+
+    def forward(self, x, out=None):
+        position = np.clip(x, -self.limit, self.limit)
+        np.add(position, self.limit, out=position)
+        np.multiply(position, self.scale, out=position)
+        index = position.astype(np.intp)
+        np.subtract(position, index, out=position)
+
+        np.multiply(position, np.take(self.slopes, index), out=position)
+        if out is None:
+            out = np.empty_like(position)
+        return np.add(np.take(self.table, index), position, out=out)
+
+
+class Tanh(Activation):
+    name = "tanh"
+
+    def forward(self, x, out=None):
+        return np.tanh(x, out=out)
+
+    def derivative(self, y, out=None):
+        out = np.multiply(y, y, out=out)
+        return np.subtract(1, out, out=out)
+
+
+class ReLU(Activation):
+    name = "relu"
+
+    def forward(self, x, out=None):
+        return np.maximum(x, 0, out=out)
+
+    def derivative(self, y, out=None):
+        if out is None:
+            out = np.empty_like(y)
+        return np.greater(y, 0, out=out)
+
+
+ACTIVATIONS = {
+    cls.name: cls for cls in (Sigmoid, HardSigmoid, PiecewiseSigmoid, LookupSigmoid, Tanh, ReLU)
+}
+
+
+def get_activation(activation):
+    """Return an Activation for a name in ``ACTIVATIONS`` or pass an instance through."""
+    if isinstance(activation, Activation):
+        return activation
+    try:
+        return ACTIVATIONS[activation]()
+    except KeyError:
+        raise ValueError("unknown activation %r, expected one of %s" % (activation, sorted(ACTIVATIONS)))
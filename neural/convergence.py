@@ -0,0 +1,70 @@
+import time
+
+import numpy as np
+
+
+def mean_squared_error(outputs, predictions):
+    return float(np.mean(np.square(outputs - predictions)))
+
+
+class LossHistory():
+    """Loss samples recorded while training, and why training stopped.
+
+    ``stop_reason`` is one of ``"tolerance"``, ``"plateau"``, ``"time_budget"``
+    or ``"max_iterations"``.
+    """
+
+    def __init__(self):
+        self.iterations = []
+        self.losses = []
+        self.stop_reason = None
+        self.elapsed = 0.0
+
+    def record(self, iteration, loss):
+        self.iterations.append(iteration)
+        self.losses.append(loss)
+
+    @property
+    def final_loss(self):
+        return self.losses[-1] if self.losses else None
+
+    def __len__(self):
+        return len(self.losses)
+
+
+class StoppingRule():
+    """Decides when a training loop can stop.
+
+    Training stops when the sampled loss drops to ``tolerance``, when it has
+    not improved by more than ``min_delta`` over ``patience`` consecutive
+    samples, or once ``time_budget`` seconds have passed. Any of them can be
+    left as None to disable it.
+    """
+
+    def __init__(self, tolerance=None, patience=None, min_delta=0.0, time_budget=None):
+        self.tolerance = tolerance
+        self.patience = patience
+        self.min_delta = min_delta
+        self.time_budget = time_budget
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.best = np.inf
+        self.stale = 0
+
+    def out_of_time(self):
+        return self.time_budget is not None and time.perf_counter() - self.started >= self.time_budget
+
+    def check(self, loss):
+        """Return the stop reason for a new loss sample, or None to carry on."""
+        if self.tolerance is not None and loss <= self.tolerance:
+            return "tolerance"
+        if loss < self.best - self.min_delta:
+            self.best = loss
+            self.stale = 0
+        else:
+            self.stale += 1
+            if self.patience is not None and self.stale >= self.patience:
+                return "plateau"
+        return None
@@ -0,0 +1,108 @@
+import queue
+import threading
+
+import numpy as np
+
+
+def open_array(source):
+    """Return ``source`` as an array without reading it into memory.
+
+    Paths to ``.npy`` files are memory-mapped read-only; arrays, including
+    ``np.memmap`` instances, are passed through untouched.
+    """
+    if isinstance(source, np.ndarray):
+        return source
+    return np.load(source, mmap_mode="r")
+
+
+class MemmapDataset():
+    """Paired inputs and outputs that stay on disk until a block is read."""
+
+    def __init__(self, inputs, outputs):
+        self.inputs = open_array(inputs)
+        self.outputs = open_array(outputs)
+        if len(self.inputs) != len(self.outputs):
+            raise ValueError("inputs and outputs have a different number of rows")
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def batches(self, batch_size, block_size=None, shuffle=True, seed=None):
+        """Yield ``(inputs, outputs)`` batches for one pass over the data.
+
+        Rows are read a block at a time with one contiguous slice, so the disk
+        sees sequential reads. Shuffling permutes the order of the blocks and
+        then the rows inside each block, which mixes the data well enough for
+        gradient descent without random access into the file.
+        """
+        block_size = block_size or batch_size * 64
+        block_size = max(batch_size, block_size - block_size % batch_size)
+        rng = np.random.RandomState(seed)
+        starts = np.arange(0, len(self), block_size)
+        if shuffle:
+            rng.shuffle(starts)
+
+        for start in starts:
+            # np.array forces the read here, on whichever thread runs this.
+            inputs = np.array(self.inputs[start:start + block_size])
+            outputs = np.array(self.outputs[start:start + block_size])
+            if shuffle:
+                order = rng.permutation(len(inputs))
+                inputs, outputs = inputs[order], outputs[order]
+            for offset in range(0, len(inputs), batch_size):
+                yield inputs[offset:offset + batch_size], outputs[offset:offset + batch_size]
+
+
+class Prefetcher():
+    """Run an iterator on a background thread, ``depth`` items ahead.
+
+    While the caller computes on one batch, the next one is already being
+    read from disk. Use it as a context manager so the thread is stopped if
+    the caller leaves the loop early.
+    """
+
+    _DONE = object()
+
+    def __init__(self, iterable, depth=2):
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._fill, args=(iter(iterable),), daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fill(self, iterator):
+        try:
+            for item in iterator:
+                if not self._put(item):
+                    return
+        except Exception as exc:
+            self._error = exc
+        self._put(self._DONE)
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield item
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
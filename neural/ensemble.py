@@ -0,0 +1,66 @@
+import numpy as np
+
+from .activations import get_activation
+from .network import NeuralNetwork
+from .optimizers import SGD
+
+
+class Ensemble():
+    """K networks with the same layer sizes, trained together as one tensor op.
+
+    Each layer's weights are stacked into a ``(K, n_in, n_out)`` array and
+    every pass uses batched ``matmul``, so the Python loop runs once for all
+    models instead of once per model. Model ``k`` starts from the same weights
+    as ``NeuralNetwork(layer_sizes, seed=seeds[k])`` and is trained by plain
+    gradient descent with its own entry of ``learning_rates``.
+    """
+
+    def __init__(self, layer_sizes, seeds, learning_rates=1.0, dtype=np.float64, activation="sigmoid"):
+        self.layer_sizes = tuple(int(n) for n in layer_sizes)
+        self.seeds = list(seeds)
+        self.dtype = np.dtype(dtype)
+        self.activation = get_activation(activation)
+        models = [NeuralNetwork(self.layer_sizes, seed=seed, dtype=self.dtype) for seed in self.seeds]
+        self.synaptic_weights = [
+            np.stack([model.synaptic_weights[layer] for model in models])
+            for layer in range(len(self.layer_sizes) - 1)
+        ]
+        # Shaped (K, 1, 1) so it scales each model's adjustments.
+        self.learning_rates = np.broadcast_to(
+            np.asarray(learning_rates, dtype=self.dtype), (len(self.seeds),)
+        ).reshape(-1, 1, 1).copy()
+
+    def __len__(self):
+        return len(self.seeds)
+
+    def _forward(self, inputs):
+        # Inputs are either shared by every model (N, n) or per model (K, N, n).
+        activations = [np.asarray(inputs, dtype=self.dtype)]
+        for weights in self.synaptic_weights:
+            weighted_sum = np.matmul(activations[-1], weights)
+            activations.append(self.activation.forward(weighted_sum, out=weighted_sum))
+        return activations
+
+    def train(self, training_set_inputs, training_set_outputs, number_of_training_iterations):
+        outputs = np.asarray(training_set_outputs, dtype=self.dtype)
+        for iteration in range(number_of_training_iterations):
+            activations = self._forward(training_set_inputs)
+            delta = (outputs - activations[-1]) * self.activation.derivative(activations[-1])
+            for layer in range(len(self.synaptic_weights) - 1, -1, -1):
+                adjustment = np.matmul(np.swapaxes(activations[layer], -1, -2), delta)
+                if layer:
+                    weights = self.synaptic_weights[layer]
+                    delta = np.matmul(delta, np.swapaxes(weights, -1, -2)) * self.activation.derivative(activations[layer])
+                adjustment *= self.learning_rates
+                self.synaptic_weights[layer] += adjustment
+
+    def think(self, inputs):
+        """Outputs of every model, shaped ``(K, N, n_out)``."""
+        return self._forward(inputs)[-1]
+
+    def network(self, k):
+        """A standalone NeuralNetwork holding a copy of model ``k``'s weights."""
+        optimizer = SGD(learning_rate=float(self.learning_rates[k, 0, 0]))
+        weights = [layer[k].copy() for layer in self.synaptic_weights]
+        return NeuralNetwork(self.layer_sizes, dtype=self.dtype, optimizer=optimizer, synaptic_weights=weights,
+                             activation=self.activation)
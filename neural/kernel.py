@@ -0,0 +1,88 @@
+import numpy as np
+
+from .binary import PackedBinary
+
+
+class TrainingKernel():
+    """Allocation-free training steps for a NeuralNetwork.
+
+    All work arrays (layer outputs, deltas, derivatives and adjustments) are
+    allocated once for a fixed ``batch_size`` and every step updates them in
+    place with ``out=`` ufuncs, in the network's dtype. The updates are the
+    same as ``NeuralNetwork.train``, only the memory traffic differs.
+    """
+
+    def __init__(self, network, batch_size):
+        self.network = network
+        self.batch_size = int(batch_size)
+        dtype = network.dtype
+        sizes = network.layer_sizes
+
+        # activations[0] holds the inputs, activations[i + 1] the output of layer i.
+        self.activations = [np.empty((self.batch_size, n), dtype=dtype) for n in sizes]
+        self.targets = np.empty((self.batch_size, sizes[-1]), dtype=dtype)
+        # deltas[i] and derivatives[i] line up with activations[i + 1].
+        self.deltas = [np.empty((self.batch_size, n), dtype=dtype) for n in sizes[1:]]
+        self.derivatives = [np.empty((self.batch_size, n), dtype=dtype) for n in sizes[1:]]
+        self.adjustments = [np.empty_like(weights) for weights in network.synaptic_weights]
+
+    def load(self, inputs, outputs):
+        # Copy a batch into the input buffers, casting to the kernel dtype.
+        if len(inputs) != self.batch_size:
+            raise ValueError("expected a batch of %d rows, got %d" % (self.batch_size, len(inputs)))
+        if isinstance(inputs, PackedBinary):
+            inputs.unpack(out=self.activations[0])
+        else:
+            np.copyto(self.activations[0], inputs, casting="unsafe")
+        np.copyto(self.targets, np.reshape(outputs, self.targets.shape), casting="unsafe")
+
+    def forward(self):
+        profiler = self.network.profiler
+        if profiler is not None:
+            profiler.start()
+        activation = self.network.activation
+        for layer, weights in enumerate(self.network.synaptic_weights):
+            out = self.activations[layer + 1]
+            np.dot(self.activations[layer], weights, out=out)
+            activation.forward(out, out=out)
+        if profiler is not None:
+            profiler.lap("forward", rows=self.batch_size)
+        return self.activations[-1]
+
+    def backward(self):
+        profiler = self.network.profiler
+        if profiler is not None:
+            profiler.start()
+        weights = self.network.synaptic_weights
+        activation = self.network.activation
+        for layer in range(len(weights)):
+            activation.derivative(self.activations[layer + 1], out=self.derivatives[layer])
+        if profiler is not None:
+            profiler.lap("derivative")
+
+        delta = self.deltas[-1]
+        np.subtract(self.targets, self.activations[-1], out=delta)
+        if profiler is not None:
+            profiler.lap("error")
+        np.multiply(delta, self.derivatives[-1], out=delta)
+
+        for layer in range(len(weights) - 1, -1, -1):
+            np.dot(self.activations[layer].T, self.deltas[layer], out=self.adjustments[layer])
+            if layer:
+                previous = self.deltas[layer - 1]
+                np.dot(self.deltas[layer], weights[layer].T, out=previous)
+                np.multiply(previous, self.derivatives[layer - 1], out=previous)
+        if profiler is not None:
+            profiler.lap("backward")
+        return self.adjustments
+
+    def step(self):
+        # One training iteration over the loaded batch.
+        self.forward()
+        self.backward()
+        self.network._apply(self.adjustments)
+
+    def run(self, inputs, outputs, number_of_training_iterations):
+        self.load(inputs, outputs)
+        for iteration in range(number_of_training_iterations):
+            self.step()
@@ -0,0 +1,101 @@
+"""Versioned on-disk format for NeuralNetwork weights.
+
+Layout::
+
+    magic    4 bytes   b"NNWT"
+    version  uint16    little endian
+    length   uint32    little endian, size of the JSON header in bytes
+    header   JSON      {"layer_sizes": [...], "dtype": "<f8", "activation": "sigmoid",
+                        "blocks": [{"offset": ..., "shape": [...]}, ...]}
+    padding  zeros up to the first block
+    blocks   raw C-order weight matrices, each starting on an ALIGNMENT-byte boundary
+
+Because the blocks are raw and aligned, ``load_network`` can map the file and
+hand out the weights as views of the mapping. Every process that loads the
+same file shares its pages through the OS page cache instead of holding its
+own copy, and a cold start is a file open rather than a training run.
+"""
+import json
+import struct
+
+import numpy as np
+
+from .network import NeuralNetwork
+
+
+MAGIC = b"NNWT"
+VERSION = 1
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<4sHI")
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_network(network, path):
+    shapes = [tuple(w.shape) for w in network.synaptic_weights]
+    dtype = network.dtype
+
+    # The header stores absolute block offsets, which depend on the header's
+    # own length, so lay it out until the length stops changing.
+    blocks, start = [], 0
+    while True:
+        offset = start
+        blocks = []
+        for shape in shapes:
+            offset = _align(offset)
+            blocks.append({"offset": offset, "shape": list(shape)})
+            offset += int(np.prod(shape)) * dtype.itemsize
+        header = json.dumps({
+            "layer_sizes": list(network.layer_sizes),
+            "dtype": dtype.str,
+            "activation": network.activation.name,
+            "blocks": blocks,
+        }).encode("utf-8")
+        first = _align(_PREAMBLE.size + len(header))
+        if first == start:
+            break
+        start = first
+
+    with open(path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for block, weights in zip(blocks, network.synaptic_weights):
+            f.write(b"\0" * (block["offset"] - f.tell()))
+            f.write(np.ascontiguousarray(weights, dtype=dtype).tobytes())
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        magic, version, length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError("%s is not a NeuralNetwork model file" % path)
+        if version != VERSION:
+            raise ValueError("unsupported model file version %d in %s" % (version, path))
+        return json.loads(f.read(length).decode("utf-8"))
+
+
+def load_network(path, mode="r", optimizer=None):
+    """Load a network saved by ``save_network``.
+
+    With ``mode="r"`` (the default) the weights are read-only views of a
+    shared memory mapping, which is what inference workers want. ``"c"``
+    maps copy-on-write, so the network can be trained further without
+    touching the file; ``None`` reads the weights into ordinary arrays.
+    """
+    header = read_header(path)
+    dtype = np.dtype(header["dtype"])
+    if mode is None:
+        with open(path, "rb") as f:
+            buffer = f.read()
+    else:
+        buffer = np.memmap(path, dtype=np.uint8, mode=mode)
+
+    weights = []
+    for block in header["blocks"]:
+        shape = tuple(block["shape"])
+        array = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=block["offset"])
+        weights.append(array.copy() if mode is None else array)
+    return NeuralNetwork(header["layer_sizes"], dtype=dtype, optimizer=optimizer, synaptic_weights=weights,
+                         activation=header.get("activation", "sigmoid"))
@@ -0,0 +1,191 @@
+import time
+
+import numpy as np
+
+from .activations import get_activation
+from .binary import PackedBinary
+from .convergence import LossHistory, StoppingRule, mean_squared_error
+from .data import Prefetcher
+from .kernel import TrainingKernel
+from .optimizers import SGD
+from .parallel import ParallelTrainer
+from .sparse import as_csr, issparse
+
+
+class NeuralNetwork():
+    """A layered feedforward network with the same train/think interface as demo.NeuralNetwork.
+
+    ``layer_sizes`` lists the width of every layer, inputs first. The default
+    ``(3, 1)`` is the single neuron from demo.py, and seeding with 1 reproduces
+    its starting weights exactly. Every pass works on the whole batch at once:
+    one matrix product per layer, no loops over samples. ``dtype`` sets the
+    precision of the weights and of every pass (float64 or float32).
+    ``optimizer`` is one of ``neural.optimizers``; the default plain SGD with
+    a learning rate of 1 is the update demo.py makes. ``activation`` is a
+    name from ``neural.activations.ACTIVATIONS`` or an Activation instance,
+    used by every layer; the default is the logistic sigmoid. Pass
+    existing ``synaptic_weights`` to use them as they are instead of random
+    ones. Inputs may be scipy.sparse matrices (see ``neural.sparse``) or
+    bit-packed binary matrices (see ``neural.binary``).
+    """
+
+    def __init__(self, layer_sizes=(3, 1), seed=1, dtype=np.float64, optimizer=None, synaptic_weights=None,
+                 activation="sigmoid"):
+        if len(layer_sizes) < 2:
+            raise ValueError("layer_sizes needs at least an input and an output layer")
+        self.layer_sizes = tuple(int(n) for n in layer_sizes)
+        self.dtype = np.dtype(dtype)
+
+        shapes = list(zip(self.layer_sizes[:-1], self.layer_sizes[1:]))
+        if synaptic_weights is not None:
+            if [tuple(w.shape) for w in synaptic_weights] != shapes:
+                raise ValueError("synaptic_weights do not match layer_sizes %s" % (self.layer_sizes,))
+            self.synaptic_weights = list(synaptic_weights)
+        else:
+            # Random weights in the range -1 to 1 with mean 0, one matrix per
+            # connection between two consecutive layers.
+            rng = np.random.RandomState(seed)
+            self.synaptic_weights = [
+                (2 * rng.random_sample((n_in, n_out)) - 1).astype(self.dtype)
+                for n_in, n_out in shapes
+            ]
+        self.optimizer = optimizer if optimizer is not None else SGD()
+        self.activation = get_activation(activation)
+        # A neural.profiling.Profiler while one is attached.
+        self.profiler = None
+
+    def _forward(self, inputs):
+        # Keep the output of every layer, the backward pass needs them all.
+        if isinstance(inputs, PackedBinary):
+            activations = [inputs]
+        elif isinstance(inputs, np.ndarray) or not issparse(inputs):
+            activations = [np.asarray(inputs, dtype=self.dtype)]
+        else:
+            activations = [as_csr(inputs, self.dtype)]
+        for weights in self.synaptic_weights:
+            # ``@`` rather than np.dot so sparse and packed inputs keep their
+            # own product.
+            weighted_sum = np.asarray(activations[-1] @ weights)
+            activations.append(self.activation.forward(weighted_sum, out=weighted_sum))
+        return activations
+
+    def adjustments(self, inputs, outputs):
+        """Backpropagate the error of one batch.
+
+        Returns the per-layer weight adjustments (same shapes as
+        ``synaptic_weights``, already pointing downhill) and the network output.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start()
+
+        activations = self._forward(inputs)
+        output = activations[-1]
+        if profiler is not None:
+            profiler.lap("forward", rows=len(output) if output.ndim > 1 else 1)
+
+        error = np.asarray(outputs, dtype=self.dtype) - output
+        if profiler is not None:
+            profiler.lap("error")
+
+        derivatives = [self.activation.derivative(a) for a in activations[1:]]
+        if profiler is not None:
+            profiler.lap("derivative")
+
+        # The error at the output layer, scaled by the gradient of the
+        # activation so less confident weights are adjusted more.
+        delta = error * derivatives[-1]
+
+        adjustments = [None] * len(self.synaptic_weights)
+        for layer in range(len(self.synaptic_weights) - 1, -1, -1):
+            adjustments[layer] = np.asarray(activations[layer].T @ delta)
+            if layer:
+                # Push the error back through this layer's weights before
+                # they are changed.
+                delta = np.dot(delta, self.synaptic_weights[layer].T) * derivatives[layer - 1]
+        if profiler is not None:
+            profiler.lap("backward")
+        return adjustments, output
+
+    def train(self, training_set_inputs, training_set_outputs, number_of_training_iterations, preallocate=False):
+        if preallocate:
+            # Same updates, but every work array is allocated once up front.
+            if issparse(training_set_inputs):
+                raise ValueError("preallocate=True needs dense inputs")
+            kernel = TrainingKernel(self, len(training_set_inputs))
+            kernel.run(training_set_inputs, training_set_outputs, number_of_training_iterations)
+            return
+
+        for iteration in range(number_of_training_iterations):
+            adjustments, _ = self.adjustments(training_set_inputs, training_set_outputs)
+            self._apply(adjustments)
+
+    def train_parallel(self, training_set_inputs, training_set_outputs, number_of_training_iterations, processes=None):
+        """Same as ``train``, with the batch split across ``processes`` worker processes.
+
+        See ``neural.parallel``; the result matches ``train`` up to float rounding.
+        """
+        with ParallelTrainer(self, training_set_inputs, training_set_outputs, processes) as trainer:
+            trainer.run(number_of_training_iterations)
+
+    def train_until(self, training_set_inputs, training_set_outputs, max_iterations=10000,
+                    tolerance=None, patience=None, min_delta=0.0, time_budget=None, sample_every=10):
+        """Train until the loss converges instead of for a fixed number of steps.
+
+        The mean squared error is sampled every ``sample_every`` iterations,
+        reusing the output the step already computed, and training stops on
+        the first of: loss at or below ``tolerance``, ``patience`` samples
+        without an improvement larger than ``min_delta``, ``time_budget``
+        seconds of wall-clock time, or ``max_iterations``. Returns the
+        ``LossHistory`` of the run.
+        """
+        rule = StoppingRule(tolerance, patience, min_delta, time_budget)
+        history = LossHistory()
+        outputs = np.asarray(training_set_outputs, dtype=self.dtype)
+
+        history.stop_reason = "max_iterations"
+        for iteration in range(max_iterations):
+            adjustments, output = self.adjustments(training_set_inputs, outputs)
+            if iteration % sample_every == 0:
+                # The output is from before this step's update, so it is the
+                # loss at ``iteration``.
+                loss = mean_squared_error(outputs, output)
+                history.record(iteration, loss)
+                reason = rule.check(loss)
+                if reason:
+                    history.stop_reason = reason
+                    break
+            self._apply(adjustments)
+            if rule.out_of_time():
+                history.stop_reason = "time_budget"
+                break
+
+        history.elapsed = time.perf_counter() - rule.started
+        return history
+
+    def train_minibatch(self, dataset, batch_size, epochs=1, block_size=None, shuffle=True, seed=None, prefetch=2):
+        """Train on a ``neural.data.MemmapDataset`` one mini-batch at a time.
+
+        Only the block being read is held in memory, so the dataset can be far
+        larger than RAM. The next batches are read on a background thread
+        while the current one is computed.
+        """
+        for epoch in range(epochs):
+            epoch_seed = None if seed is None else seed + epoch
+            batches = dataset.batches(batch_size, block_size=block_size, shuffle=shuffle, seed=epoch_seed)
+            with Prefetcher(batches, depth=prefetch) as prefetcher:
+                for inputs, outputs in prefetcher:
+                    adjustments, _ = self.adjustments(inputs, outputs)
+                    self._apply(adjustments)
+
+    def _apply(self, adjustments):
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start()
+        # The optimizer may use the adjustment arrays as scratch space.
+        self.optimizer.update(self.synaptic_weights, adjustments)
+        if profiler is not None:
+            profiler.lap("update")
+
+    def think(self, inputs):
+        return self._forward(inputs)[-1]
@@ -0,0 +1,113 @@
+"""Weight update rules for NeuralNetwork.
+
+Each optimizer turns the per-layer adjustments from backpropagation (which
+already point downhill) into weight changes. Their state arrays have the
+same shapes as ``synaptic_weights`` and are created on the first update, so
+an optimizer instance belongs to exactly one network. Updates run in place
+and use the adjustment arrays as scratch space, so a step allocates nothing.
+"""
+import numpy as np
+
+
+class Optimizer():
+    def __init__(self, learning_rate):
+        self.learning_rate = learning_rate
+        self.state = None
+        self.iterations = 0
+
+    def _zeros(self, synaptic_weights, count):
+        return [[np.zeros_like(weights) for weights in synaptic_weights] for _ in range(count)]
+
+    def _init_state(self, synaptic_weights):
+        return []
+
+    def update(self, synaptic_weights, adjustments):
+        if self.state is None:
+            self.state = self._init_state(synaptic_weights)
+        self.iterations += 1
+        for layer, (weights, adjustment) in enumerate(zip(synaptic_weights, adjustments)):
+            self._update_layer(layer, weights, adjustment)
+
+    def _update_layer(self, layer, weights, adjustment):
+        raise NotImplementedError
+
+
+class SGD(Optimizer):
+    """Gradient descent, optionally with momentum.
+
+    With the defaults (``learning_rate=1``, no momentum) this is exactly the
+    update demo.py performs.
+    """
+
+    def __init__(self, learning_rate=1.0, momentum=0.0):
+        super().__init__(learning_rate)
+        self.momentum = momentum
+
+    def _init_state(self, synaptic_weights):
+        return self._zeros(synaptic_weights, 1) if self.momentum else []
+
+    def _update_layer(self, layer, weights, adjustment):
+        if self.learning_rate != 1:
+            np.multiply(adjustment, self.learning_rate, out=adjustment)
+        if self.momentum:
+            velocity = self.state[0][layer]
+            np.multiply(velocity, self.momentum, out=velocity)
+            np.add(velocity, adjustment, out=velocity)
+            adjustment = velocity
+        np.add(weights, adjustment, out=weights)
+
+
+class RMSProp(Optimizer):
+    def __init__(self, learning_rate=0.01, decay=0.9, epsilon=1e-8):
+        super().__init__(learning_rate)
+        self.decay = decay
+        self.epsilon = epsilon
+
+    def _init_state(self, synaptic_weights):
+        # Running mean of squared adjustments, plus one scratch array per layer.
+        return self._zeros(synaptic_weights, 2)
+
+    def _update_layer(self, layer, weights, adjustment):
+        square_mean, scratch = self.state[0][layer], self.state[1][layer]
+        np.multiply(adjustment, adjustment, out=scratch)
+        np.multiply(scratch, 1 - self.decay, out=scratch)
+        np.multiply(square_mean, self.decay, out=square_mean)
+        np.add(square_mean, scratch, out=square_mean)
+
+        np.sqrt(square_mean, out=scratch)
+        np.add(scratch, self.epsilon, out=scratch)
+        np.divide(adjustment, scratch, out=scratch)
+        np.multiply(scratch, self.learning_rate, out=scratch)
+        np.add(weights, scratch, out=weights)
+
+
+class Adam(Optimizer):
+    def __init__(self, learning_rate=0.01, beta1=0.9, beta2=0.999, epsilon=1e-8):
+        super().__init__(learning_rate)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def _init_state(self, synaptic_weights):
+        # First moment, second moment and one scratch array per layer.
+        return self._zeros(synaptic_weights, 3)
+
+    def _update_layer(self, layer, weights, adjustment):
+        mean, square_mean, scratch = (self.state[i][layer] for i in range(3))
+        np.multiply(mean, self.beta1, out=mean)
+        np.multiply(adjustment, 1 - self.beta1, out=scratch)
+        np.add(mean, scratch, out=mean)
+
+        np.multiply(square_mean, self.beta2, out=square_mean)
+        np.multiply(adjustment, adjustment, out=scratch)
+        np.multiply(scratch, 1 - self.beta2, out=scratch)
+        np.add(square_mean, scratch, out=square_mean)
+
+        # Fold the bias correction of both moments into the step size.
+        t = self.iterations
+        step_size = self.learning_rate * np.sqrt(1 - self.beta2 ** t) / (1 - self.beta1 ** t)
+        np.sqrt(square_mean, out=scratch)
+        np.add(scratch, self.epsilon, out=scratch)
+        np.divide(mean, scratch, out=scratch)
+        np.multiply(scratch, step_size, out=scratch)
+        np.add(weights, scratch, out=weights)
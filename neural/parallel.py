@@ -0,0 +1,174 @@
+"""Data-parallel training across a pool of worker processes.
+
+The training set is copied once into shared memory and split into one shard
+of rows per worker. Every step the parent publishes the current weights in a
+shared block, each worker backpropagates its shard and writes its
+adjustments into its own row of a shared gradient block, and the parent sums
+the rows and applies them through the network's optimizer. No array is ever
+pickled after start-up.
+
+Adjustments are sums over rows, so adding up the shards gives the full-batch
+adjustment and the result matches ``NeuralNetwork.train`` up to float
+rounding.
+"""
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .binary import PackedBinary
+from .sparse import issparse
+
+
+def _shared_array(shape, dtype, source=None):
+    dtype = np.dtype(dtype)
+    size = max(1, int(np.prod(shape)) * dtype.itemsize)
+    block = shared_memory.SharedMemory(create=True, size=size)
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    if source is not None:
+        np.copyto(array, source, casting="unsafe")
+    return block, array
+
+
+def _attach(name, shape, dtype):
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _split_layers(flat, layer_sizes):
+    # Views of one flat buffer, shaped like synaptic_weights.
+    views, offset = [], 0
+    for n_in, n_out in zip(layer_sizes[:-1], layer_sizes[1:]):
+        views.append(flat[offset:offset + n_in * n_out].reshape(n_in, n_out))
+        offset += n_in * n_out
+    return views
+
+
+def _serve(index, rows, arrays, layer_sizes, dtype, activation, start, done, stop):
+    # Imported here so spawned workers do not need the parent's globals.
+    from .network import NeuralNetwork
+
+    first, last = rows
+    inputs = arrays["inputs"][first:last]
+    outputs = arrays["outputs"][first:last]
+    gradient = _split_layers(arrays["gradients"][index], layer_sizes)
+
+    weights = _split_layers(arrays["weights"], layer_sizes)
+    network = NeuralNetwork(layer_sizes, dtype=dtype, synaptic_weights=weights, activation=activation)
+
+    while True:
+        start.wait()
+        if stop.value:
+            return
+        if last > first:
+            adjustments, _ = network.adjustments(inputs, outputs)
+            for target, adjustment in zip(gradient, adjustments):
+                np.copyto(target, adjustment)
+        done.wait()
+
+
+def _worker(index, rows, layout, layer_sizes, dtype, activation, start, done, stop):
+    blocks, arrays = [], {}
+    try:
+        for key, (name, shape) in layout.items():
+            block, arrays[key] = _attach(name, shape, dtype)
+            blocks.append(block)
+        _serve(index, rows, arrays, layer_sizes, dtype, activation, start, done, stop)
+    except Exception:
+        # Wake the parent instead of leaving it blocked on a barrier.
+        start.abort()
+        done.abort()
+        raise
+    finally:
+        arrays.clear()
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                # A traceback still holds views; the process is exiting anyway.
+                pass
+
+
+class ParallelTrainer():
+    """Train ``network`` on ``inputs``/``outputs`` with ``processes`` workers.
+
+    Use it as a context manager, or call ``close`` when done, so the workers
+    are stopped and the shared memory is released.
+    """
+
+    def __init__(self, network, inputs, outputs, processes=None):
+        if issparse(inputs):
+            raise ValueError("parallel training needs dense inputs")
+        self.network = network
+        self.processes = processes or multiprocessing.cpu_count()
+        dtype = network.dtype
+        # Workers read their shard densely out of shared memory.
+        inputs = inputs.unpack(dtype) if isinstance(inputs, PackedBinary) else np.asarray(inputs)
+        outputs = np.reshape(outputs, (len(inputs), -1))
+        weight_count = sum(w.size for w in network.synaptic_weights)
+
+        self._blocks = {}
+        self._arrays = {}
+        for key, shape, source in (
+            ("inputs", inputs.shape, inputs),
+            ("outputs", outputs.shape, outputs),
+            ("weights", (weight_count,), None),
+            ("gradients", (self.processes, weight_count), 0),
+        ):
+            self._blocks[key], self._arrays[key] = _shared_array(shape, dtype, source)
+        self._weights = _split_layers(self._arrays["weights"], network.layer_sizes)
+        layout = {key: (block.name, self._arrays[key].shape) for key, block in self._blocks.items()}
+
+        context = multiprocessing.get_context()
+        self._start = context.Barrier(self.processes + 1)
+        self._done = context.Barrier(self.processes + 1)
+        self._stop = context.Value("b", 0)
+        bounds = np.linspace(0, len(inputs), self.processes + 1).astype(int)
+        self._workers = [
+            context.Process(
+                target=_worker,
+                args=(i, (bounds[i], bounds[i + 1]), layout, network.layer_sizes, dtype.str,
+                      network.activation, self._start, self._done, self._stop),
+                daemon=True,
+            )
+            for i in range(self.processes)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def step(self):
+        for shared, weights in zip(self._weights, self.network.synaptic_weights):
+            np.copyto(shared, weights)
+        self._start.wait()
+        self._done.wait()
+        total = self._arrays["gradients"].sum(axis=0)
+        self.network._apply(_split_layers(total, self.network.layer_sizes))
+
+    def run(self, number_of_training_iterations):
+        for iteration in range(number_of_training_iterations):
+            self.step()
+
+    def close(self):
+        if self._workers is None:
+            return
+        self._stop.value = 1
+        try:
+            self._start.wait(timeout=5)
+        except Exception:
+            pass
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = None
+        self._weights = None
+        self._arrays.clear()
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
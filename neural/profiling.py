@@ -0,0 +1,166 @@
+"""Per-phase timing for NeuralNetwork training.
+
+A training step is split into five phases: ``forward`` (the pass through
+every layer), ``error`` (targets minus output), ``derivative`` (the
+activation gradient of every layer's output), ``backward`` (the matrix
+products that turn the error into adjustments) and ``update`` (the
+optimizer step). Attach a Profiler to see where the time goes::
+
+    with profile(network, trace_allocations=True) as profiler:
+        network.train(inputs, outputs, 1000)
+    print(profiler.report())
+    profiler.write_chrome_trace("train.json")  # open in chrome://tracing or Perfetto
+
+While no profiler is attached the training loop only pays a ``None`` check
+per phase. Each phase also gets a FLOP estimate from the layer sizes, and,
+with ``trace_allocations``, the peak bytes it allocated according to
+tracemalloc, which slows training down considerably while it is on.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+
+PHASES = ("forward", "error", "derivative", "backward", "update")
+
+
+def estimate_flops(layer_sizes, rows):
+    """Approximate floating point operations per phase for one step over ``rows`` rows."""
+    pairs = list(zip(layer_sizes[:-1], layer_sizes[1:]))
+    products = sum(n_in * n_out for n_in, n_out in pairs)
+    hidden_products = sum(n_in * n_out for n_in, n_out in pairs[1:])
+    outputs = sum(n_out for _, n_out in pairs)
+    return {
+        "forward": 2 * rows * products + 4 * rows * outputs,
+        "error": rows * layer_sizes[-1],
+        "derivative": 2 * rows * outputs,
+        "backward": 2 * rows * products + 2 * rows * hidden_products + rows * outputs,
+        "update": 2 * products,
+    }
+
+
+class PhaseStats():
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.flops = 0
+        self.allocated_bytes = 0
+
+
+class Profiler():
+    """Collects per-phase statistics while attached to a network.
+
+    ``callbacks`` are called as ``callback(phase, seconds, flops)`` at the
+    end of every phase. ``record_events`` keeps one timeline event per phase
+    for ``write_chrome_trace``.
+    """
+
+    def __init__(self, layer_sizes, callbacks=(), record_events=True, trace_allocations=False):
+        self.layer_sizes = tuple(layer_sizes)
+        self.callbacks = list(callbacks)
+        self.record_events = record_events
+        self.trace_allocations = trace_allocations
+        self.stats = {phase: PhaseStats() for phase in PHASES}
+        self.events = []
+        self._flops = {}
+        self._rows = 0
+        self._traced = 0
+        self._origin = time.perf_counter()
+        self._last = self._origin
+
+    def _flops_for(self, phase):
+        if self._rows not in self._flops:
+            self._flops[self._rows] = estimate_flops(self.layer_sizes, self._rows)
+        return self._flops[self._rows][phase]
+
+    def start(self):
+        """Start timing the next phase from now."""
+        if self.trace_allocations:
+            self._traced = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._last = time.perf_counter()
+
+    def lap(self, phase, rows=None):
+        """Close ``phase``: everything since the last ``start`` or ``lap`` is charged to it."""
+        now = time.perf_counter()
+        if rows is not None:
+            self._rows = rows
+        seconds = now - self._last
+        flops = self._flops_for(phase)
+
+        stats = self.stats[phase]
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.flops += flops
+        if self.trace_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            stats.allocated_bytes += peak - self._traced
+            self._traced = current
+            tracemalloc.reset_peak()
+        if self.record_events:
+            self.events.append((phase, self._last - self._origin, seconds, flops))
+        for callback in self.callbacks:
+            callback(phase, seconds, flops)
+        # Do not charge this bookkeeping to the next phase.
+        self._last = time.perf_counter()
+
+    def summary(self):
+        total = sum(stats.seconds for stats in self.stats.values()) or 1.0
+        return {
+            phase: {
+                "calls": stats.calls,
+                "seconds": stats.seconds,
+                "share": stats.seconds / total,
+                "flops": stats.flops,
+                "gflops_per_sec": stats.flops / stats.seconds / 1e9 if stats.seconds else 0.0,
+                "allocated_bytes": stats.allocated_bytes if self.trace_allocations else None,
+            }
+            for phase, stats in self.stats.items()
+        }
+
+    def report(self):
+        lines = ["%-11s %8s %10s %7s %10s %14s" % ("phase", "calls", "seconds", "share", "GFLOP/s", "alloc bytes")]
+        for phase, row in self.summary().items():
+            allocated = "-" if row["allocated_bytes"] is None else "%d" % row["allocated_bytes"]
+            lines.append("%-11s %8d %10.4f %6.1f%% %10.2f %14s" % (
+                phase, row["calls"], row["seconds"], row["share"] * 100, row["gflops_per_sec"], allocated))
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path):
+        """Write the recorded events in Chrome trace event format."""
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [
+            {
+                "name": phase,
+                "cat": "train",
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": seconds * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {"flops": flops},
+            }
+            for phase, start, seconds, flops in self.events
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+@contextlib.contextmanager
+def profile(network, **kwargs):
+    """Attach a Profiler to ``network`` for the duration of the block."""
+    profiler = Profiler(network.layer_sizes, **kwargs)
+    previous = network.profiler
+    started_tracing = profiler.trace_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    network.profiler = profiler
+    try:
+        yield profiler
+    finally:
+        network.profiler = previous
+        if started_tracing:
+            tracemalloc.stop()
@@ -0,0 +1,103 @@
+"""Post-training int8 quantization for inference.
+
+``quantize(network)`` turns each layer's weights into int8 with one scale per
+layer (``max|W| / 127``), so a model takes 1/8 of its float64 memory. At
+``think`` time each layer's input is quantized to int8 values the same way
+with one scale per row, so a row's output does not depend on what else is
+in the batch. The integer product is accumulated exactly and rescaled before
+the activation.
+
+NumPy has no fast integer matrix product, so the integer accumulation runs
+on float32 BLAS: int8 x int8 products summed over at most ``_EXACT_DEPTH``
+terms stay below 2**24 and are therefore exact in float32. Deeper sums are
+split into chunks of that size and the exact partial sums added in float64.
+Only the int8 weights are kept; each chunk is widened when it is used.
+"""
+import numpy as np
+
+
+_EXACT_DEPTH = (1 << 24) // (127 * 127)
+
+
+def _symmetric_scale(values):
+    peak = float(np.max(np.abs(values))) if values.size else 0.0
+    return peak / 127 if peak else 1.0
+
+
+def _row_scales(values):
+    peak = np.max(np.abs(values), axis=1, keepdims=True)
+    # All-zero rows quantize to zeros with any scale.
+    peak[peak == 0] = 127
+    return peak / 127
+
+
+def _quantize(values, scale):
+    quantized = np.divide(values, scale, dtype=np.float32)
+    np.rint(quantized, out=quantized)
+    return np.clip(quantized, -127, 127, out=quantized)
+
+
+def _integer_dot(quantized_inputs, quantized_weights):
+    depth = quantized_weights.shape[0]
+    if depth <= _EXACT_DEPTH:
+        return np.dot(quantized_inputs, quantized_weights.astype(np.float32))
+    total = np.zeros((quantized_inputs.shape[0], quantized_weights.shape[1]), dtype=np.float64)
+    for start in range(0, depth, _EXACT_DEPTH):
+        stop = start + _EXACT_DEPTH
+        total += np.dot(quantized_inputs[:, start:stop], quantized_weights[start:stop].astype(np.float32))
+    return total
+
+
+class QuantizedNetwork():
+    def __init__(self, layer_sizes, synaptic_weights, scales, activation):
+        self.layer_sizes = tuple(layer_sizes)
+        self.synaptic_weights = synaptic_weights
+        self.scales = scales
+        self.activation = activation
+
+    @property
+    def nbytes(self):
+        return sum(weights.nbytes for weights in self.synaptic_weights)
+
+    def think(self, inputs):
+        inputs = np.asarray(inputs, dtype=np.float32)
+        single = inputs.ndim == 1
+        layer_input = inputs[np.newaxis] if single else inputs
+        for weights, weight_scale in zip(self.synaptic_weights, self.scales):
+            input_scales = _row_scales(layer_input)
+            weighted_sum = _integer_dot(_quantize(layer_input, input_scales), weights)
+            weighted_sum = np.multiply(weighted_sum, input_scales * weight_scale, dtype=np.float32)
+            layer_input = self.activation.forward(weighted_sum, out=weighted_sum)
+        return layer_input[0] if single else layer_input
+
+
+def quantize(network):
+    """Return an int8 QuantizedNetwork with the same layers and activation as ``network``."""
+    weights, scales = [], []
+    for layer in network.synaptic_weights:
+        scale = _symmetric_scale(layer)
+        weights.append(_quantize(layer, scale).astype(np.int8))
+        scales.append(scale)
+    return QuantizedNetwork(network.layer_sizes, weights, scales, network.activation)
+
+
+def compare(network, quantized, inputs, outputs=None):
+    """How far the quantized outputs are from the float ones on ``inputs``.
+
+    With ``outputs`` it also reports the accuracy (outputs rounded at 0.5)
+    of both models, which is the number to check on a held-out set.
+    """
+    expected = network.think(inputs)
+    actual = quantized.think(inputs)
+    difference = np.abs(expected - actual)
+    report = {
+        "max_abs_diff": float(difference.max()),
+        "mean_abs_diff": float(difference.mean()),
+        "float_bytes": sum(w.nbytes for w in network.synaptic_weights),
+        "int8_bytes": quantized.nbytes,
+    }
+    if outputs is not None:
+        outputs = np.asarray(outputs).reshape(expected.shape)
+        report["float_accuracy"] = float(np.mean((expected > 0.5) == (outputs > 0.5)))
+        report["int8_accuracy"] = float(np.mean((actual > 0.5) == (outputs > 0.5)))
+    return report
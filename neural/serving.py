@@ -0,0 +1,197 @@
+"""Micro-batching inference service around NeuralNetwork.think.
+
+Concurrent single-row requests are collected for up to ``max_latency``
+seconds (or until ``max_batch_size`` rows are waiting) and answered with one
+``think`` call for the whole batch, so the Python and NumPy dispatch cost is
+paid per batch instead of per row.
+
+The server speaks newline-delimited JSON over TCP or a Unix socket::
+
+    {"inputs": [1, 0, 0]}   ->  {"outputs": [0.9999]}
+    {"stats": true}         ->  {"requests": ..., "p50_ms": ..., "p99_ms": ..., ...}
+
+Run ``python -m neural.serving --model model.nnw`` to serve a saved network,
+or without ``--model`` to serve the demo network.
+"""
+import argparse
+import asyncio
+import collections
+import json
+import time
+
+import numpy as np
+
+
+class MicroBatcher():
+    """Batches concurrent ``predict`` calls into single ``think`` calls.
+
+    ``start`` must be awaited from inside the running event loop before the
+    first ``predict``.
+    """
+
+    def __init__(self, network, max_batch_size=64, max_latency=0.002, window=10000):
+        self.network = network
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._latencies = collections.deque(maxlen=window)
+        self._queue = None
+        self._task = None
+        self.requests = 0
+        self.batches = 0
+        self.started = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        self.started = time.perf_counter()
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, inputs):
+        """Return the network output for one input row."""
+        inputs = np.asarray(inputs, dtype=self.network.dtype)
+        # Reject bad rows here so they cannot fail the batch they would join.
+        if inputs.shape != (self.network.layer_sizes[0],):
+            raise ValueError("expected one row of %d inputs, got shape %s" % (self.network.layer_sizes[0], inputs.shape))
+        queued = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((inputs, future))
+        result = await future
+        self._latencies.append(time.perf_counter() - queued)
+        return result
+
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_latency
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            batch = [(inputs, future) for inputs, future in batch if not future.done()]
+            if not batch:
+                continue
+            try:
+                outputs = self.network.think(np.stack([inputs for inputs, _ in batch]))
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            self.requests += len(batch)
+            self.batches += 1
+            for (_, future), output in zip(batch, outputs):
+                future.set_result(output)
+
+    def stats(self):
+        """Latency percentiles over the last ``window`` requests, and throughput."""
+        elapsed = time.perf_counter() - self.started if self.started else 0.0
+        latencies = np.asarray(self._latencies) * 1000
+        p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (0.0, 0.0)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "p50_ms": float(p50),
+            "p99_ms": float(p99),
+            "requests_per_sec": self.requests / elapsed if elapsed else 0.0,
+        }
+
+
+async def _handle(batcher, reader, writer):
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+                if "inputs" in request:
+                    outputs = await batcher.predict(request["inputs"])
+                    response = {"outputs": outputs.tolist()}
+                elif request.get("stats"):
+                    response = batcher.stats()
+                else:
+                    response = {"error": "expected 'inputs' or 'stats'"}
+            except Exception as exc:
+                response = {"error": str(exc)}
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(network, host="127.0.0.1", port=8765, path=None, max_batch_size=64, max_latency=0.002):
+    """Serve ``network`` until cancelled, on ``path`` (a Unix socket) if given, else on host:port."""
+    batcher = MicroBatcher(network, max_batch_size=max_batch_size, max_latency=max_latency)
+    await batcher.start()
+
+    async def handle(reader, writer):
+        await _handle(batcher, reader, writer)
+
+    if path:
+        server = await asyncio.start_unix_server(handle, path=path)
+    else:
+        server = await asyncio.start_server(handle, host=host, port=port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.close()
+
+
+def _demo_network():
+    from .network import NeuralNetwork
+
+    network = NeuralNetwork()
+    inputs = np.array([[0, 0, 1], [1, 1, 1], [1, 0, 1], [0, 1, 1]])
+    outputs = np.array([[0, 1, 1, 0]]).T
+    network.train(inputs, outputs, 10000)
+    return network
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-batching inference server for NeuralNetwork")
+    parser.add_argument("--model", type=str, default=None, help="model file written by neural.model_file.save_network")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", type=str, default=None, help="serve on this Unix socket path instead of TCP")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-latency-ms", type=float, default=2.0, help="how long to wait for a batch to fill")
+    args = parser.parse_args()
+
+    if args.model:
+        from .model_file import load_network
+
+        network = load_network(args.model)
+    else:
+        network = _demo_network()
+
+    try:
+        asyncio.run(serve(
+            network,
+            host=args.host,
+            port=args.port,
+            path=args.unix,
+            max_batch_size=args.max_batch_size,
+            max_latency=args.max_latency_ms / 1000,
+        ))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,23 @@
+"""Optional scipy.sparse inputs.
+
+NeuralNetwork accepts CSR (or any scipy.sparse) input matrices in ``train``
+and ``think``. The inputs only meet the first layer's weights, once going
+forward (inputs @ weights) and once going back (inputs.T @ delta), and
+both products are done sparse, so their cost scales with the number of
+nonzeros instead of rows x width. Every later layer is dense anyway.
+
+scipy is only needed when sparse inputs are actually passed.
+"""
+
+
+def issparse(x):
+    try:
+        from scipy import sparse
+    except ImportError:
+        return False
+    return sparse.issparse(x)
+
+
+def as_csr(x, dtype):
+    # No copy when x is already CSR in the right dtype.
+    return x.tocsr().astype(dtype, copy=False)
@@ -0,0 +1,69 @@
+import time
+
+from tools.ai_hotlist.dedup import near_deduplicate
+
+
+MODEL_VARIANTS = [
+    "Qwen/Qwen2.5-7B",
+    "Qwen/Qwen2.5-7B-Instruct",
+    "deepseek-ai/DeepSeek-R1-Distill-Qwen-7B",
+    "deepseek-ai/DeepSeek-R1-Distill-Qwen-14B",
+    "meta-llama/Llama-3.1-8B",
+    "meta-llama/Llama-3.1-8B-Instruct",
+    "mistralai/Mistral-7B-v0.3",
+    "mistralai/Mistral-7B-Instruct-v0.3",
+]
+
+
+def _items(kind, titles):
+    return [
+        {"type": kind, "title": t, "url": f"https://huggingface.co/{t}", "summary": None, "metrics": {"likes": i}}
+        for i, t in enumerate(titles)
+    ]
+
+
+def test_model_variants_are_kept_apart():
+    items = _items("model", MODEL_VARIANTS) + _items("open-source", MODEL_VARIANTS)
+    out = near_deduplicate(items, threshold=0.5)
+    assert [it["title"] for it in out] == [it["title"] for it in items]
+    assert [it["metrics"] for it in out] == [{"likes": i} for i in range(len(MODEL_VARIANTS))] * 2
+
+
+def test_same_story_from_two_sources_is_merged():
+    summary = "The new open model beats larger rivals on reasoning benchmarks and ships under a permissive license."
+    items = [
+        {"type": "news", "title": "Lab releases open reasoning model", "summary": summary, "metrics": {"source_weight": 3}},
+        {"type": "news", "title": "Lab releases open reasoning model!", "summary": summary + " Weights are out today.",
+         "metrics": {"source_weight": 1, "share_count": 5}},
+        {"type": "paper", "title": "An unrelated paper on protein folding", "summary": "Structure prediction.", "metrics": {}},
+    ]
+    out = near_deduplicate(items)
+    assert [it["title"] for it in out] == [items[0]["title"], items[2]["title"]]
+    assert out[0]["metrics"] == {"source_weight": 3, "share_count": 5}
+
+
+def test_types_none_considers_every_type():
+    items = _items("model", ["org/model-alpha-base-v1", "org/model-alpha-base-v1 "])
+    assert len(near_deduplicate(items, types=None)) == 1
+    assert len(near_deduplicate(items)) == 2
+
+
+def test_templated_titles_stay_apart_and_stay_fast():
+    items = [
+        {"type": "news", "title": f"AI weekly roundup {i}", "summary": "", "metrics": {"share_count": i}}
+        for i in range(4000)
+    ]
+    start = time.perf_counter()
+    out = near_deduplicate(items)
+    # Every pair shares two of its four shingles; comparing every candidate pair took 30+ s here.
+    assert time.perf_counter() - start < 10
+    assert [it["metrics"] for it in out] == [{"share_count": i} for i in range(4000)]
+
+
+def test_templated_near_duplicates_are_still_merged():
+    items = []
+    for i in range(1000):
+        items.append({"type": "news", "title": f"AI weekly roundup {i} edition", "summary": "", "metrics": {}})
+        items.append({"type": "news", "title": f"AI weekly roundup {i} edition out", "summary": "", "metrics": {}})
+    out = near_deduplicate(items)
+    assert [it["title"] for it in out] == [f"AI weekly roundup {i} edition" for i in range(1000)]
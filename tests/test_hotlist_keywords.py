@@ -0,0 +1,40 @@
+import warnings
+
+import pytest
+
+from tools.ai_hotlist.keywords import KeywordFilter
+from tools.ai_hotlist.text import normalize_text
+
+
+def _passes(keywords, text):
+    return keywords.passes(normalize_text(text))
+
+
+@pytest.mark.parametrize("term", ["C#", "C++"])
+def test_punctuated_short_terms_match_whole_words(term):
+    with pytest.warns(UserWarning, match="whole word 'c'"):
+        deny = KeywordFilter([], [term])
+    assert _passes(deny, "DeepSeek releases a compact reasoning model")
+    assert not _passes(deny, f"{term} 13 ships with a new compiler")
+
+    with pytest.warns(UserWarning):
+        allow = KeywordFilter([term], [])
+    assert not _passes(allow, "DeepSeek releases a compact reasoning model")
+    assert _passes(allow, f"What's new in {term} this year")
+
+
+def test_dotnet_does_not_match_network():
+    with pytest.warns(UserWarning, match="'net'"):
+        deny = KeywordFilter([], [".NET"])
+    assert _passes(deny, "A new neural network for speech")
+    assert not _passes(deny, ".NET 9 adds AI building blocks")
+
+
+def test_plain_terms_are_unchanged():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        keywords = KeywordFilter(["ai", "gpt-4", "大模型"], ["crypto"])
+    assert _passes(keywords, "She said it was fine")
+    assert _passes(keywords, "GPT-4o benchmark results")
+    assert _passes(keywords, "国产大模型发布")
+    assert not _passes(keywords, "AI meets crypto")
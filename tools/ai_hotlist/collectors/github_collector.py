@@ -1,35 +1,100 @@
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
+import json
 import os
-import requests
-from ..utils import within_days, parse_date
+from ..http_cache import get_cache
+from ..http_client import get_session
+from ..utils import Partial, within_days, parse_date, run_concurrently
 
 GITHUB_API = "https://api.github.com"
+# The search API serves at most this many results per query.
+GITHUB_SEARCH_MAX_RESULTS = 1000
+
+
+class GitHubRateLimitError(RuntimeError):
+    pass
 
 
 class GitHubClient:
     def __init__(self, token: Optional[str] = None):
-        self.session = requests.Session()
-        self.session.headers.update({"Accept": "application/vnd.github+json"})
+        # Headers go with each request: the pooled session is shared with other hosts.
+        self.headers = {"Accept": "application/vnd.github+json"}
         if token:
-            self.session.headers.update({"Authorization": f"Bearer {token}"})
+            self.headers["Authorization"] = f"Bearer {token}"
+        # Why the last search_all stopped early, if it did.
+        self.errors: List[str] = []
 
-    def search_repos(self, q: str, sort: str = "stars", order: str = "desc", per_page: int = 50) -> List[Dict[str, Any]]:
+    def _fetch(self, url: str, **kwargs: Any) -> Any:
+        # GitHub answers an exhausted rate limit with 403 (which the session does not retry)
+        # or 429; both, and any other error status, raise instead of reading as "no results".
+        r = get_session().get(url, **kwargs)
+        if r.status_code in (403, 429) and (
+            r.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in r.headers
+        ):
+            reset = r.headers.get("X-RateLimit-Reset")
+            when = datetime.utcfromtimestamp(int(reset)).strftime("%H:%M:%S UTC") if reset and reset.isdigit() else None
+            wait = r.headers.get("Retry-After")
+            raise GitHubRateLimitError(
+                "GitHub rate limit exceeded"
+                + (f", resets at {when}" if when else "")
+                + (f", retry after {wait}s" if wait else "")
+                + ("" if "Authorization" in self.headers else "; set GITHUB_TOKEN for a higher limit")
+            )
+        r.raise_for_status()
+        return r
+
+    def search_repos(
+        self, q: str, sort: str = "stars", order: str = "desc", per_page: int = 50, page: int = 1
+    ) -> List[Dict[str, Any]]:
         url = f"{GITHUB_API}/search/repositories"
-        params = {"q": q, "sort": sort, "order": order, "per_page": per_page}
-        r = self.session.get(url, params=params, timeout=30)
-        if r.status_code != 200:
-            return []
-        data = r.json()
-        return data.get("items", [])
+        params = {"q": q, "sort": sort, "order": order, "per_page": per_page, "page": page}
+        repos = get_cache().get(
+            "github",
+            url,
+            lambda text: json.loads(text).get("items", []),
+            params=params,
+            headers=self.headers,
+            fetch=self._fetch,
+        )
+        return repos or []
+
+    def search_all(
+        self, q: str, limit: int, sort: str = "stars", order: str = "desc", concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Up to ``limit`` results of ``q``, fetching ``concurrency`` pages at a time.
 
+        Stops at the first short page, which is the end of the results, or
+        at the first page that failed (a rate limit, an error status, a
+        network error); the failure is recorded in ``self.errors`` and the
+        pages before it are returned.
+        """
+        self.errors = []
+        per_page = max(1, min(100, limit))
+        pages = min(-(-limit // per_page), GITHUB_SEARCH_MAX_RESULTS // per_page)
+        repos: List[Dict[str, Any]] = []
+        for first in range(1, pages + 1, concurrency):
+            wave = range(first, min(first + concurrency, pages + 1))
+            tasks = {str(p): (lambda p=p: self.search_repos(q, sort, order, per_page, page=p)) for p in wave}
+            results, status = run_concurrently(tasks, max_workers=concurrency)
+            for p in wave:
+                if status[str(p)]["status"] != "ok":
+                    self.errors.append(f"page {p}: {status[str(p)].get('error') or status[str(p)]['status']}")
+                    return repos[:limit]
+                got = results.get(str(p)) or []
+                repos += got
+                if len(got) < per_page:
+                    return repos[:limit]
+        return repos[:limit]
 
-def collect_github(days: int, token: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+
+def collect_github(
+    days: int, token: Optional[str] = None, limit: int = 100, concurrency: int = 4
+) -> List[Dict[str, Any]]:
     client = GitHubClient(token)
     since_date = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
     q_created = f"created:>={since_date}"
-    repos = client.search_repos(q_created, sort="stars", order="desc", per_page=min(100, limit))
-    items: List[Dict[str, Any]] = []
+    repos = client.search_all(q_created, limit, sort="stars", order="desc", concurrency=concurrency)
+    items = Partial(errors=client.errors)
     for r in repos:
         title = r.get("full_name")
         url = r.get("html_url")
@@ -54,54 +119,57 @@ def collect_github(days: int, token: Optional[str] = None, limit: int = 100) ->
     return items
 
 
-def collect_github_trending() -> List[Dict[str, Any]]:
-    # Scrape trending monthly page
-    import requests
+def _parse_trending(html: str) -> List[Dict[str, Any]]:
     from bs4 import BeautifulSoup
 
-    url = "https://github.com/trending?since=monthly"
     items: List[Dict[str, Any]] = []
+    soup = BeautifulSoup(html, "html.parser")
+    li = soup.select("article.Box-row")
+    rank = 0
+    for row in li:
+        rank += 1
+        h2 = row.select_one("h2 a")
+        if not h2:
+            continue
+        full_name = h2.get_text(strip=True).replace("\n", "").replace(" ", "")
+        href = h2.get("href")
+        url = f"https://github.com{href}"
+        lang_el = row.select_one("span[itemprop='programmingLanguage']")
+        lang = lang_el.get_text(strip=True) if lang_el else None
+        # Stars text (today or period)
+        star_spans = row.select("a Link--muted"); new_stars = None
+        # More robust parse of "stars added" line
+        added_el = row.find(text=lambda t: t and "stars" in t and "since" in t)
+        if added_el:
+            try:
+                new_stars = int("".join([ch for ch in added_el if ch.isdigit()]))
+            except Exception:
+                new_stars = None
+        items.append(
+            {
+                "type": "open-source",
+                "title": full_name,
+                "url": url,
+                "summary": None,
+                "date": None,
+                "source": "GitHub Trending",
+                "metrics": {
+                    "trending_rank": rank,
+                    "new_stars": new_stars,
+                    "language": lang,
+                },
+            }
+        )
+    return items
+
+
+def collect_github_trending() -> List[Dict[str, Any]]:
+    # Scrape trending monthly page
+    url = "https://github.com/trending?since=monthly"
     try:
-        r = requests.get(url, timeout=30, headers={"Accept": "text/html,application/xhtml+xml"})
-        if r.status_code != 200:
-            return items
-        soup = BeautifulSoup(r.text, "html.parser")
-        li = soup.select("article.Box-row")
-        rank = 0
-        for row in li:
-            rank += 1
-            h2 = row.select_one("h2 a")
-            if not h2:
-                continue
-            full_name = h2.get_text(strip=True).replace("\n", "").replace(" ", "")
-            href = h2.get("href")
-            url = f"https://github.com{href}"
-            lang_el = row.select_one("span[itemprop='programmingLanguage']")
-            lang = lang_el.get_text(strip=True) if lang_el else None
-            # Stars text (today or period)
-            star_spans = row.select("a Link--muted"); new_stars = None
-            # More robust parse of "stars added" line
-            added_el = row.find(text=lambda t: t and "stars" in t and "since" in t)
-            if added_el:
-                try:
-                    new_stars = int("".join([ch for ch in added_el if ch.isdigit()]))
-                except Exception:
-                    new_stars = None
-            items.append(
-                {
-                    "type": "open-source",
-                    "title": full_name,
-                    "url": url,
-                    "summary": None,
-                    "date": None,
-                    "source": "GitHub Trending",
-                    "metrics": {
-                        "trending_rank": rank,
-                        "new_stars": new_stars,
-                        "language": lang,
-                    },
-                }
-            )
+        items = get_cache().get(
+            "github_trending", url, _parse_trending, headers={"Accept": "text/html,application/xhtml+xml"}
+        )
     except Exception:
-        return items
-    return items
+        return []
+    return items or []
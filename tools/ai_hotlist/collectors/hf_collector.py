@@ -1,26 +1,47 @@
 from typing import Any, Dict, List, Optional
-import requests
-from ..utils import parse_date, within_days
+import json
+from ..http_cache import get_cache
+from ..http_client import get_session
+from ..utils import Partial, parse_date, within_days
 
 
 HF_MODELS_API = "https://huggingface.co/api/models"
 HF_DATASETS_API = "https://huggingface.co/api/datasets"
 
 
-def _fetch(endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+def _get(url: str, **kwargs: Any) -> Any:
+    # An error status raises, so a failed page is not taken for the end of the listing.
+    r = get_session().get(url, **kwargs)
+    r.raise_for_status()
+    return r
+
+
+def _fetch(name: str, endpoint: str, params: Dict[str, Any], days: int, max_pages: int) -> Partial:
+    # Results are sorted newest first and paged with a cursor in the Link header,
+    # so pages are walked in order and the walk stops once a page reaches past the window.
+    # A failed page ends the walk; the pages before it are kept and the error recorded.
+    data = Partial()
+    url: str = endpoint
+    page_params: Optional[Dict[str, Any]] = params
+    number = 1
     try:
-        r = requests.get(endpoint, params=params or {}, timeout=30)
-        if r.status_code != 200:
-            return []
-        return r.json()
-    except Exception:
-        return []
+        for number in range(1, max_pages + 1):
+            page, next_url = get_cache().get_page(name, url, json.loads, params=page_params, fetch=_get)
+            if not page:
+                break
+            data += page
+            if not next_url or not within_days(parse_date(page[-1].get("lastModified")), days):
+                break
+            url, page_params = next_url, None
+    except Exception as e:
+        data.errors.append(f"page {number}: {e}")
+    return data
 
 
-def collect_hf_models(days: int, limit: int = 100) -> List[Dict[str, Any]]:
+def collect_hf_models(days: int, limit: int = 100, max_pages: int = 1) -> List[Dict[str, Any]]:
     params = {"sort": "lastModified", "direction": -1, "limit": limit}
-    data = _fetch(HF_MODELS_API, params=params)
-    items: List[Dict[str, Any]] = []
+    data = _fetch("hf_models", HF_MODELS_API, params, days, max_pages)
+    items = Partial(errors=data.errors)
     for m in data:
         last_modified = parse_date(m.get("lastModified"))
         if not within_days(last_modified, days):
@@ -44,10 +65,10 @@ def collect_hf_models(days: int, limit: int = 100) -> List[Dict[str, Any]]:
     return items
 
 
-def collect_hf_datasets(days: int, limit: int = 100) -> List[Dict[str, Any]]:
+def collect_hf_datasets(days: int, limit: int = 100, max_pages: int = 1) -> List[Dict[str, Any]]:
     params = {"sort": "lastModified", "direction": -1, "limit": limit}
-    data = _fetch(HF_DATASETS_API, params=params)
-    items: List[Dict[str, Any]] = []
+    data = _fetch("hf_datasets", HF_DATASETS_API, params, days, max_pages)
+    items = Partial(errors=data.errors)
     for d in data:
         last_modified = parse_date(d.get("lastModified"))
         if not within_days(last_modified, days):
@@ -3,6 +3,7 @@ from datetime import datetime
 
 import feedparser
 
+from ..http_client import get_session
 from ..utils import parse_date, within_days, normalize_url
 
 
@@ -40,38 +41,38 @@ def guess_source(entry: Any, feed_url: str) -> str:
     return str(src)
 
 
-def collect_news(feeds: List[str], days: int) -> List[Dict[str, Any]]:
+def collect_feed(url: str, days: int) -> List[Dict[str, Any]]:
+    r = get_session().get(url, timeout=30)
+    if r.status_code != 200:
+        return []
+    parsed = feedparser.parse(r.content)
     items: List[Dict[str, Any]] = []
-    for url in feeds:
-        try:
-            parsed = feedparser.parse(url)
-        except Exception:
+    entries = getattr(parsed, "entries", []) or []
+    for e in entries:
+        link = normalize_url(getattr(e, "link", ""))
+        title = getattr(e, "title", "")
+        summary = getattr(e, "summary", getattr(e, "description", ""))
+        published = None
+        for k in ["published", "updated", "created"]:
+            if hasattr(e, k):
+                published = parse_date(getattr(e, k))
+                if published:
+                    break
+        if not within_days(published, days):
             continue
-        entries = getattr(parsed, "entries", []) or []
-        for e in entries:
-            link = normalize_url(getattr(e, "link", ""))
-            title = getattr(e, "title", "")
-            summary = getattr(e, "summary", getattr(e, "description", ""))
-            published = None
-            for k in ["published", "updated", "created"]:
-                if hasattr(e, k):
-                    published = parse_date(getattr(e, k))
-                    if published:
-                        break
-            if not within_days(published, days):
-                continue
-            source = guess_source(e, url)
-            weight = NEWS_SOURCE_WEIGHTS.get(source, 1)
-            item = {
-                "type": "news",
-                "title": title,
-                "url": link,
-                "summary": summary,
-                "date": published,
-                "source": source,
-                "metrics": {
-                    "source_weight": weight,
-                },
-            }
-            items.append(item)
+        source = guess_source(e, url)
+        weight = NEWS_SOURCE_WEIGHTS.get(source, 1)
+        item = {
+            "type": "news",
+            "title": title,
+            "url": link,
+            "summary": summary,
+            "date": published,
+            "source": source,
+            "metrics": {
+                "source_weight": weight,
+            },
+        }
+        items.append(item)
     return items
+
@@ -1,6 +1,8 @@
 import os
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
+
+from .http_cache import DEFAULT_MAX_BYTES, DEFAULT_TTLS
 
 
 @dataclass
@@ -8,10 +10,57 @@ class HotlistConfig:
     days: int = 30
     allowlist: List[str] = field(default_factory=list)
     denylist: List[str] = field(default_factory=list)
+    # ASCII allow/deny terms match whole words only ("ai" does not match "said")
+    keyword_word_boundaries: bool = False
     max_items_per_section: int = 100
+
+    # Scoring: a named profile from scoring.SCORING_PROFILES, then per-type weight overrides,
+    # e.g. {"model": {"likes": 2.0}, "recency": 5.0}
+    scoring_profile: str = "default"
+    scoring_weights: Dict[str, Any] = field(default_factory=dict)
     output_dir_data: str = os.path.abspath(os.path.join(os.getcwd(), "data"))
     output_dir_reports: str = os.path.abspath(os.path.join(os.getcwd(), "reports"))
 
+    # Concurrent collection: seconds allowed per source (each RSS feed is one) and for the
+    # whole stage; deadlines count from the start, so keep enough workers for every source
+    source_timeout: float = 45.0
+    collect_timeout: float = 90.0
+    collect_workers: int = 16
+
+    # Pagination: GitHub search results to fetch (pages fetched concurrently),
+    # Hugging Face page size and page cap (walked until the --days window ends)
+    github_limit: int = 500
+    github_page_concurrency: int = 4
+    hf_page_size: int = 1000
+    hf_max_pages: int = 10
+
+    # Near-duplicate merging: MinHash/LSH over title and summary shingles (0 disables), only
+    # for these types; repo and model titles are IDs whose variants look alike
+    near_dup_threshold: float = 0.7
+    near_dup_types: List[str] = field(default_factory=lambda: ["news", "paper"])
+    minhash_perms: int = 64
+    lsh_bands: int = 16
+    # LSH buckets larger than this come from templated text and are skipped
+    near_dup_max_bucket: int = 100
+
+    # SQLite item store reused across runs (defaults to <output_dir_data>/ai_hotlist.sqlite3);
+    # items unseen for store_retention_days are dropped
+    use_store: bool = True
+    store_path: Optional[str] = None
+    store_retention_days: int = 90
+
+    # Pooled HTTP session shared by the collectors
+    http_pool_size: int = 16
+    http_retries: int = 3
+    http_backoff: float = 0.5
+
+    # On-disk HTTP cache shared by the collectors; TTLs in seconds per endpoint. Each run
+    # first drops entries older than 8x the largest TTL, then the oldest beyond cache_max_bytes
+    use_cache: bool = True
+    cache_dir: str = os.path.abspath(os.path.join(os.getcwd(), ".cache", "ai_hotlist"))
+    cache_ttls: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TTLS))
+    cache_max_bytes: int = DEFAULT_MAX_BYTES
+
     # Sources
     rss_feeds: List[str] = field(
         default_factory=lambda: [
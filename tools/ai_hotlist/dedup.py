@@ -0,0 +1,169 @@
+import itertools
+import re
+import zlib
+from typing import Any, Collection, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .text import text_view
+from .utils import merge_metrics
+
+
+# Shingle hashes are permuted with multiply-shift hashing: the high 32 bits
+# of (a * h + b) mod 2**64, which uint64 arithmetic computes by wrapping.
+_SHIFT = np.uint64(32)
+_MIX = 0x9E3779B97F4A7C15
+_LOW32 = 0xFFFFFFFF
+# ASCII words and single CJK characters.
+_TOKEN = re.compile(r"[a-z0-9]+|[\u4e00-\u9fff]")
+
+
+class MinHasher:
+    """MinHash signatures over token shingles of an item's title and summary.
+
+    Tokens are ASCII words and single CJK characters, so a shingle of two
+    tokens is a word bigram in English and a character bigram in Chinese.
+    """
+
+    def __init__(self, num_perm: int = 64, shingle: int = 2, max_chars: int = 400, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.shingle = shingle
+        self.max_chars = max_chars
+        self.a = rng.randint(0, 1 << 62, size=(num_perm, 1)).astype(np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = rng.randint(0, 1 << 62, size=(num_perm, 1)).astype(np.uint64)
+
+    def shingles(self, item: Dict[str, Any]) -> List[int]:
+        """Distinct 32-bit hashes of the item's token n-grams."""
+        # The start of the shared normalized view: the title and the opening of the summary.
+        text = text_view(item).norm[: self.max_chars]
+        hashes = [zlib.crc32(t.encode("utf-8")) for t in _TOKEN.findall(text)]
+        for _ in range(1, min(self.shingle, len(hashes))):
+            # Fold the next token's hash in: hashes[i] becomes the hash of tokens i..i+k.
+            hashes = [((h * _MIX) ^ nxt) & _LOW32 for h, nxt in zip(hashes, hashes[1:])]
+        return list(set(hashes))
+
+    def signatures(self, shingle_sets: Sequence[Collection[int]], chunk: int = 2048) -> Tuple[np.ndarray, np.ndarray]:
+        """An (items, num_perm) signature matrix of ``shingles`` results and a mask of the non-empty ones.
+
+        Shingles of ``chunk`` items are hashed in one array operation and
+        reduced per item with ``np.minimum.reduceat``.
+        """
+        out = np.zeros((len(shingle_sets), self.num_perm), dtype=np.uint64)
+        valid = np.zeros(len(shingle_sets), dtype=bool)
+        for first in range(0, len(shingle_sets), chunk):
+            shingled = shingle_sets[first : first + chunk]
+            sizes = np.array([len(h) for h in shingled])
+            if not sizes.any():
+                continue
+            flat = np.fromiter(itertools.chain.from_iterable(shingled), dtype=np.uint64, count=int(sizes.sum()))
+            hashed = self.a * flat[np.newaxis, :]
+            hashed += self.b
+            hashed >>= _SHIFT
+            present = np.flatnonzero(sizes)
+            starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))[present]
+            out[first + present] = np.minimum.reduceat(hashed, starts, axis=1).T
+            valid[first + present] = True
+        return out, valid
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _band_groups(keys: np.ndarray) -> List[np.ndarray]:
+    # Indices sharing a key, in ascending order, for every key held by two or more.
+    order = np.argsort(keys, kind="stable")
+    ordered = keys[order]
+    edges = np.flatnonzero(ordered[1:] != ordered[:-1]) + 1
+    starts = np.concatenate(([0], edges))
+    stops = np.concatenate((edges, [len(keys)]))
+    return [order[a:b] for a, b in zip(starts, stops) if b - a > 1]
+
+
+def _jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def near_deduplicate(
+    items: List[Dict[str, Any]],
+    threshold: float = 0.7,
+    num_perm: int = 64,
+    bands: int = 16,
+    types: Optional[Iterable[str]] = ("news", "paper"),
+    max_bucket: int = 100,
+) -> List[Dict[str, Any]]:
+    """Merge items of the same type whose title+summary shingles are near-duplicates.
+
+    Only items whose type is in ``types`` (all items if None) take part: the
+    same story or paper turns up from several sources with slightly different
+    wording, while repository and model titles are IDs with no summary, and
+    variants like "Qwen2.5-7B" and "Qwen2.5-7B-Instruct" are different
+    items that merely share most of their tokens.
+
+    Signatures are split into ``bands`` bands and items of one type sharing
+    a band are candidates. Each candidate is compared with the groups
+    already found in that band (one comparison per group, each pair at most
+    once), and merged if the exact Jaccard similarity of the shingle sets
+    reaches ``threshold``; the MinHash estimate only proposes pairs. A band
+    value shared by more than ``max_bucket`` items comes from templated text
+    ("AI weekly roundup 12", "... 13", ...) rather than one story and is
+    skipped, which keeps the stage near-linear. Each group keeps its first
+    item, with the others' metrics merged in by ``merge_metrics``. Items
+    keep their order.
+    """
+    kinds = None if types is None else set(types)
+    # Positions in ``items`` of the items that take part.
+    members_of = [i for i, it in enumerate(items) if kinds is None or it.get("type") in kinds]
+    if len(members_of) < 2:
+        return items
+    subset = [items[i] for i in members_of]
+    hasher = MinHasher(num_perm=num_perm)
+    rows = num_perm // bands
+    shingle_sets = [hasher.shingles(it) for it in subset]
+    sigs, valid = hasher.signatures(shingle_sets)
+    shingle_sets = [frozenset(h) for h in shingle_sets]
+    indices = np.flatnonzero(valid)
+    type_codes: Dict[Any, int] = {}
+    type_keys = np.array([type_codes.setdefault(subset[i].get("type"), len(type_codes)) for i in indices], dtype=np.uint64)
+    mix = np.random.RandomState(2).randint(1, 1 << 62, size=rows).astype(np.uint64) | np.uint64(1)
+
+    parent = list(range(len(subset)))
+    compared: Set[Tuple[int, int]] = set()
+    for band in range(bands):
+        # One 64-bit key per (type, band slice); collisions only add candidates, which are verified.
+        keys = (sigs[indices, band * rows : (band + 1) * rows] * mix).sum(axis=1, dtype=np.uint64)
+        keys ^= type_keys * np.uint64(_MIX)
+        for group in _band_groups(keys):
+            if len(group) > max_bucket:
+                continue
+            roots: List[int] = []
+            for j in indices[group]:
+                j = int(j)
+                rj = _find(parent, j)
+                for ri in {_find(parent, r) for r in roots}:
+                    if ri == rj or (ri, j) in compared or subset[ri].get("type") != subset[j].get("type"):
+                        continue
+                    compared.add((ri, j))
+                    if _jaccard(shingle_sets[ri], shingle_sets[j]) >= threshold:
+                        parent[max(ri, rj)] = min(ri, rj)
+                        rj = min(ri, rj)
+                roots.append(rj)
+
+    merged = set()
+    for k, it in enumerate(subset):
+        root = _find(parent, k)
+        if root == k:
+            continue
+        merged.add(members_of[k])
+        keep = subset[root]
+        keep["metrics"] = merge_metrics(keep.get("metrics", {}), it.get("metrics", {}))
+        if not keep.get("date") and it.get("date"):
+            keep["date"] = it["date"]
+    return [it for i, it in enumerate(items) if i not in merged]
@@ -0,0 +1,221 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .http_client import get_session
+
+
+# Seconds a cached response is served without asking the server again.
+DEFAULT_TTLS: Dict[str, float] = {
+    "github": 30 * 60,
+    "github_trending": 3 * 3600,
+    "hf_models": 30 * 60,
+    "hf_datasets": 30 * 60,
+    "pwc": 3 * 3600,
+}
+
+# Entries untouched for this many times the largest TTL are deleted by ``prune``.
+PRUNE_AFTER_TTLS = 8
+# Size cap on the cache directory; the least recently refreshed entries go first.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class HttpCache:
+    """On-disk cache of GET responses and their parsed values.
+
+    Each entry keeps the ETag/Last-Modified validators and the value
+    ``parse`` produced from the body. Within the endpoint's TTL the
+    parsed value is returned without touching the network; after it, the
+    request is revalidated with If-None-Match/If-Modified-Since and a 304
+    also reuses the parsed value, so neither the download nor the parse is
+    repeated. If the server errors, a stale entry is served rather than
+    nothing. Entries nothing has refreshed for a while are removed by
+    ``prune``, which ``configure`` runs.
+    """
+
+    def __init__(self, directory: str, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 3600, enabled: bool = True):
+        self.directory = directory
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+        self.stats: Dict[str, int] = {"hit": 0, "revalidated": 0, "miss": 0, "stale": 0, "pruned": 0}
+        self._lock = threading.Lock()
+
+    def _path(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        key = url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".pickle")
+
+    def _load(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def _store(self, path: str, entry: Dict[str, Any]) -> None:
+        # Write to a temporary file and rename, so concurrent collectors never read half an entry.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
+    def prune(self, max_age: Optional[float] = None, max_bytes: Optional[int] = DEFAULT_MAX_BYTES) -> int:
+        """Delete old entries and cap the directory size; returns the number of files removed.
+
+        An entry's file is rewritten whenever it is fetched or revalidated,
+        so its mtime is its last refresh. Entries (and leftover temporary
+        files) older than ``max_age`` seconds, by default ``PRUNE_AFTER_TTLS``
+        times the largest TTL, are deleted; then the oldest are deleted until
+        the rest fit in ``max_bytes``. Hugging Face pages after the first are
+        keyed by cursor URLs that change between runs, so without this the
+        directory only grows.
+        """
+        if max_age is None:
+            max_age = PRUNE_AFTER_TTLS * max(list(self.ttls.values()) + [self.default_ttl])
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        files = []
+        for name in names:
+            if not name.endswith((".pickle", ".tmp")):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        files.sort(reverse=True)
+
+        cutoff = time.time() - max_age
+        total = 0
+        removed = 0
+        for mtime, size, path in files:
+            if mtime >= cutoff and (max_bytes is None or total + size <= max_bytes):
+                total += size
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self.stats["pruned"] += removed
+        return removed
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def get(
+        self,
+        endpoint: str,
+        url: str,
+        parse: Callable[[str], Any],
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        fetch: Optional[Callable[..., Any]] = None,
+        timeout: float = 30,
+    ) -> Any:
+        """GET ``url`` and return ``parse(body)``, from the cache when possible.
+
+        ``endpoint`` picks the TTL. ``fetch`` defaults to the shared
+        session's ``get``. Returns None when the request fails and nothing
+        is cached.
+        """
+        return self.get_page(endpoint, url, parse, params, headers, fetch, timeout)[0]
+
+    def get_page(
+        self,
+        endpoint: str,
+        url: str,
+        parse: Callable[[str], Any],
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        fetch: Optional[Callable[..., Any]] = None,
+        timeout: float = 30,
+    ) -> Tuple[Any, Optional[str]]:
+        """Like ``get``, but also returns the ``rel="next"`` URL of the Link header (or None)."""
+        fetch = fetch or get_session().get
+        if not self.enabled:
+            r = fetch(url, params=params, headers=headers, timeout=timeout)
+            if r.status_code != 200:
+                return None, None
+            return parse(r.text), r.links.get("next", {}).get("url")
+
+        path = self._path(url, params)
+        entry = self._load(path)
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if entry and time.time() - entry["fetched_at"] < ttl:
+            self._count("hit")
+            return entry["value"], entry.get("next")
+
+        request_headers = dict(headers or {})
+        if entry and entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            r = fetch(url, params=params, headers=request_headers, timeout=timeout)
+        except Exception:
+            if entry:
+                self._count("stale")
+                return entry["value"], entry.get("next")
+            raise
+
+        if r.status_code == 304 and entry:
+            entry["fetched_at"] = time.time()
+            self._store(path, entry)
+            self._count("revalidated")
+            return entry["value"], entry.get("next")
+        if r.status_code != 200:
+            if entry:
+                self._count("stale")
+                return entry["value"], entry.get("next")
+            return None, None
+
+        value = parse(r.text)
+        next_url = r.links.get("next", {}).get("url")
+        self._store(
+            path,
+            {
+                "url": url,
+                "fetched_at": time.time(),
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "next": next_url,
+                "value": value,
+            },
+        )
+        self._count("miss")
+        return value, next_url
+
+
+_cache = HttpCache(os.path.abspath(os.path.join(os.getcwd(), ".cache", "ai_hotlist")))
+
+
+def configure(
+    directory: str,
+    ttls: Optional[Dict[str, float]] = None,
+    enabled: bool = True,
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+) -> HttpCache:
+    """Replace the cache the collectors share, pruning its directory first."""
+    global _cache
+    _cache = HttpCache(directory, ttls=ttls, enabled=enabled)
+    if enabled:
+        _cache.prune(max_bytes=max_bytes)
+    return _cache
+
+
+def get_cache() -> HttpCache:
+    return _cache
@@ -0,0 +1,56 @@
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+USER_AGENT = "ai-hotlist/1.0"
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def build_session(pool_size: int = 16, retries: int = 3, backoff: float = 0.5) -> requests.Session:
+    """A keep-alive session with a connection pool and retries on transient errors.
+
+    Connection errors, 429 and 5xx answers to GET/HEAD are retried up to
+    ``retries`` times, sleeping ``backoff * 2**n`` seconds in between (and
+    honouring Retry-After).
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+def configure(pool_size: int = 16, retries: int = 3, backoff: float = 0.5) -> requests.Session:
+    """Replace the session the collectors share."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = build_session(pool_size, retries, backoff)
+        return _session
+
+
+def get_session() -> requests.Session:
+    global _session
+    with _lock:
+        if _session is None:
+            _session = build_session()
+        return _session
@@ -0,0 +1,134 @@
+import warnings
+from collections import deque
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from .text import normalize_text
+
+
+ALLOW = 1
+DENY = 2
+
+# Normalized ASCII terms this short always match whole words only when normalization
+# stripped punctuation from them ("C#", "C++" -> "c", ".NET" -> "net"); one-letter terms always do.
+SHORT_TERM = 3
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over a fixed list of terms.
+
+    Matching walks the text once, following failure links on a mismatch, so
+    its cost depends on the length of the text and the number of matches,
+    not on the number of terms.
+    """
+
+    def __init__(self, terms: Sequence[str]):
+        self.terms = list(terms)
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, term in enumerate(self.terms):
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(index)
+
+        # Breadth-first, so a state's failure target is finished before its children need it.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                queue.append(nxt)
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield ``(term index, end)`` for every occurrence, with ``text[end - len(term):end]`` the match."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    yield index, i + 1
+
+
+class KeywordFilter:
+    """Allow/deny keyword lists compiled once into one automaton.
+
+    An item passes if its text contains any allow term (or there are none)
+    and no deny term. Terms go through ``normalize_text`` like the item text.
+    With ``word_boundaries``, terms made only of ASCII characters must match
+    whole words (no ASCII letter or digit right before or after), so "ai"
+    no longer matches inside "said"; other terms still match anywhere, since
+    Chinese text has no spaces between words.
+
+    Normalization strips punctuation, so "C#" and "C++" both become "c" and
+    ".NET" becomes "net". As substrings those would match nearly every item,
+    so one-letter ASCII terms, and ASCII terms of up to ``SHORT_TERM``
+    characters that lost punctuation, always match whole words only, with a
+    warning for the latter: "C#" then matches "C# 13" (and "C 13"), but not
+    "compact".
+    """
+
+    def __init__(self, allow: Sequence[str], deny: Sequence[str], word_boundaries: bool = False):
+        kinds: Dict[str, int] = {}
+        forced = set()
+        for kind, terms in ((ALLOW, allow), (DENY, deny)):
+            for raw in terms:
+                term = normalize_text(raw)
+                if not term:
+                    continue
+                kinds[term] = kinds.get(term, 0) | kind
+                if term.isascii() and len(term) <= SHORT_TERM and term != " ".join(raw.lower().split()):
+                    forced.add(term)
+                    warnings.warn(
+                        f"keyword {raw!r} is matched as the whole word {term!r} (punctuation is ignored)",
+                        stacklevel=2,
+                    )
+        self.terms = list(kinds)
+        self.has_allow = any(k & ALLOW for k in kinds.values())
+        self.has_deny = any(k & DENY for k in kinds.values())
+        self._kinds = [kinds[t] for t in self.terms]
+        self._bounded = [
+            t.isascii() and (word_boundaries or len(t) == 1 or t in forced) for t in self.terms
+        ]
+        self._automaton = AhoCorasick(self.terms)
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def passes(self, text: str) -> bool:
+        allowed = not self.has_allow
+        for index, end in self._automaton.iter_matches(text):
+            if self._bounded[index]:
+                start = end - len(self.terms[index])
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]):
+                    continue
+            kind = self._kinds[index]
+            if kind & DENY:
+                return False
+            if kind & ALLOW:
+                allowed = True
+                if not self.has_deny:
+                    return True
+        return allowed
@@ -1,43 +1,47 @@
 #!/usr/bin/env python3
 import argparse
+import heapq
 import os
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 from datetime import datetime
 
+from . import http_cache, http_client
 from .config import DEFAULT_CONFIG, HotlistConfig
-from .utils import ensure_dirs, normalize_text, merge_metrics, dump_json, format_date
-from .collectors.news import collect_news
+from .dedup import near_deduplicate
+from .keywords import KeywordFilter
+from .utils import chunked, ensure_dirs, normalize_text, merge_metrics, dump_json, stream_json, format_date, run_concurrently
+from .collectors.news import collect_feed
 from .collectors.arxiv_collector import collect_arxiv
 from .collectors.pwc import collect_pwc_trending
 from .collectors.github_collector import collect_github, collect_github_trending
 from .collectors.hf_collector import collect_hf_models, collect_hf_datasets
 from .summarizer import apply_cn_summary
-from .scoring import score_item
+from .scoring import SCORING_PROFILES, resolve_weights, score_items, weights_key
+from .store import ItemStore
+from .text import clear_views, text_view
 
 
-def filter_by_keywords(items: List[Dict[str, Any]], allow: List[str], deny: List[str]) -> List[Dict[str, Any]]:
-    if not allow and not deny:
-        return items
-    out = []
+# Report section of each item type; other types are left out of the report.
+SECTIONS = {"news": "news", "paper": "papers", "open-source": "oss", "model": "oss"}
+
+
+def filter_by_keywords(
+    items: Iterable[Dict[str, Any]], allow: List[str], deny: List[str], word_boundaries: bool = False
+) -> Iterator[Dict[str, Any]]:
+    keywords = KeywordFilter(allow, deny, word_boundaries=word_boundaries)
+    if not keywords:
+        yield from items
+        return
     for it in items:
-        text = f"{it.get('title') or ''} {it.get('summary') or ''}"
-        t = normalize_text(text)
-        passed = True
-        if allow:
-            passed = any(a.lower() in t for a in allow)
-        if passed and deny:
-            if any(d.lower() in t for d in deny):
-                passed = False
-        if passed:
-            out.append(it)
-    return out
+        if keywords.passes(text_view(it).norm):
+            yield it
 
 
-def deduplicate(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def deduplicate(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     seen_keys = {}
     out: List[Dict[str, Any]] = []
     for it in items:
-        key = normalize_text(it.get("title") or it.get("url") or "")
+        key = text_view(it).title_norm if it.get("title") else normalize_text(it.get("url") or "")
         if not key:
             out.append(it)
             continue
@@ -53,16 +57,25 @@ def deduplicate(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return out
 
 
-def categorize(items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
-    news, papers, oss = [], [], []
-    for it in items:
-        if it.get("type") == "news":
-            news.append(it)
-        elif it.get("type") == "paper":
-            papers.append(it)
-        elif it.get("type") in ("open-source", "model"):
-            oss.append(it)
-    return news, papers, oss
+def select_top(items: Iterable[Dict[str, Any]], k: int) -> Dict[str, List[Dict[str, Any]]]:
+    """The ``k`` highest-scoring items of each section, best first.
+
+    Keeps one size-``k`` min-heap per section, so memory does not grow with
+    the number of items. Ties keep their input order.
+    """
+    heaps: Dict[str, List[Tuple[float, int, Dict[str, Any]]]] = {name: [] for name in set(SECTIONS.values())}
+    for seq, it in enumerate(items):
+        section = SECTIONS.get(it.get("type"))
+        if section is None or k <= 0:
+            continue
+        # -seq ranks earlier items higher on equal scores and keeps dicts out of comparisons.
+        entry = (it.get("score", 0), -seq, it)
+        heap = heaps[section]
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    return {name: [entry[2] for entry in sorted(heap, key=lambda e: e[:2], reverse=True)] for name, heap in heaps.items()}
 
 
 def build_markdown(date_str: str, news: List[Dict[str, Any]], papers: List[Dict[str, Any]], oss: List[Dict[str, Any]]) -> str:
@@ -93,68 +106,118 @@ def build_markdown(date_str: str, news: List[Dict[str, Any]], papers: List[Dict[
     return "\n".join(md)
 
 
-def run(config: HotlistConfig) -> Dict[str, Any]:
-    ensure_dirs(config.output_dir_data, config.output_dir_reports)
+def collect_all(config: HotlistConfig) -> Tuple[Iterator[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Run every collector at once.
 
-    items: List[Dict[str, Any]] = []
+    Every RSS feed is a source of its own (``news:<feed url>``), so one slow
+    feed cannot hold up the others. A source that fails or runs past
+    ``config.source_timeout`` is skipped, and the stage as a whole stops
+    waiting after ``config.collect_timeout``, so the wall time is bounded by
+    the slowest source rather than their sum. Returns an iterator over the
+    items, in source order, and a status entry per source.
+    """
+    token = os.environ.get(config.github_token_env)
+    sources: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+        f"news:{url}": (lambda url=url: collect_feed(url, config.days)) for url in config.rss_feeds
+    }
+    sources.update({
+        "arxiv": lambda: collect_arxiv(config.days),
+        "pwc": lambda: collect_pwc_trending(),
+        "github": lambda: collect_github(
+            config.days, token=token, limit=config.github_limit, concurrency=config.github_page_concurrency
+        ),
+        "github_trending": lambda: collect_github_trending(),
+        "hf_models": lambda: collect_hf_models(config.days, limit=config.hf_page_size, max_pages=config.hf_max_pages),
+        "hf_datasets": lambda: collect_hf_datasets(config.days, limit=config.hf_page_size, max_pages=config.hf_max_pages),
+    })
+    results, status = run_concurrently(
+        sources,
+        task_timeout=config.source_timeout,
+        total_timeout=config.collect_timeout,
+        max_workers=config.collect_workers,
+    )
+    for name in sources:
+        status[name]["count"] = len(results.get(name) or [])
 
-    # Collect
-    try:
-        items += collect_news(config.rss_feeds, config.days)
-    except Exception:
-        pass
-    try:
-        items += collect_arxiv(config.days)
-    except Exception:
-        pass
-    try:
-        items += collect_pwc_trending()
-    except Exception:
-        pass
-    try:
-        items += collect_github(config.days, token=os.environ.get(config.github_token_env))
-    except Exception:
-        pass
-    try:
-        items += collect_github_trending()
-    except Exception:
-        pass
-    try:
-        items += collect_hf_models(config.days)
-    except Exception:
-        pass
+    def stream() -> Iterator[Dict[str, Any]]:
+        # Hand each source's list over and drop it, so it can be freed once consumed.
+        for name in sources:
+            yield from results.pop(name, None) or []
+
+    return stream(), status
+
+
+def _scored(
+    items: Iterable[Dict[str, Any]], score: Callable[[List[Dict[str, Any]]], List[float]], batch: int = 500
+) -> Iterator[Dict[str, Any]]:
+    for chunk in chunked(items, batch):
+        for it, value in zip(chunk, score(chunk)):
+            it["score"] = value
+        yield from chunk
+
+
+def run(config: HotlistConfig) -> Dict[str, Any]:
+    clear_views()
     try:
-        items += collect_hf_datasets(config.days)
-    except Exception:
-        pass
+        return _run(config)
+    finally:
+        # The shared text views hold every item's text; free them with the run.
+        clear_views()
 
-    # Filter
-    items = filter_by_keywords(items, config.allowlist, config.denylist)
 
-    # Dedup
-    items = deduplicate(items)
+def _run(config: HotlistConfig) -> Dict[str, Any]:
+    ensure_dirs(config.output_dir_data, config.output_dir_reports)
 
-    # Score, summarize
-    for it in items:
-        it["score"] = score_item(it)
-        it = apply_cn_summary(it)
+    # Collect
+    http_client.configure(config.http_pool_size, config.http_retries, config.http_backoff)
+    cache = http_cache.configure(
+        config.cache_dir, ttls=config.cache_ttls, enabled=config.use_cache, max_bytes=config.cache_max_bytes
+    )
+    items, sources = collect_all(config)
 
-    # Sort by score
-    items = sorted(items, key=lambda x: x.get("score", 0), reverse=True)
+    # Filter (streaming)
+    items = filter_by_keywords(items, config.allowlist, config.denylist, config.keyword_word_boundaries)
 
-    # Categorize and cap
-    news, papers, oss = categorize(items)
-    news = news[: config.max_items_per_section]
-    papers = papers[: config.max_items_per_section]
-    oss = oss[: config.max_items_per_section]
+    # Dedup: exact titles, then near-duplicates; this index is the only stage that holds every item
+    unique = deduplicate(items)
+    if config.near_dup_threshold > 0:
+        unique = near_deduplicate(
+            unique, config.near_dup_threshold, config.minhash_perms, config.lsh_bands,
+            types=config.near_dup_types, max_bucket=config.near_dup_max_bucket,
+        )
+    total = len(unique)
 
-    # Export
     date_str = datetime.utcnow().strftime("%Y%m%d")
     raw_path = os.path.join(config.output_dir_data, f"ai_hotlist_raw_{date_str}.json")
     agg_path = os.path.join(config.output_dir_data, f"ai_hotlist_{date_str}.json")
     report_path = os.path.join(config.output_dir_reports, f"ai-hotlist-{date_str}.md")
 
-    dump_json(raw_path, items)
+    store = None
+    if config.use_store:
+        store = ItemStore(config.store_path or os.path.join(config.output_dir_data, "ai_hotlist.sqlite3"))
+    try:
+        # Score (streaming; stored scores are reused for unchanged items), write raw, keep the top k per section
+        weights = resolve_weights(config.scoring_profile, config.scoring_weights)
+
+        def score(batch: List[Dict[str, Any]]) -> List[float]:
+            return score_items(batch, weights)
+
+        scored = store.scored(unique, score, weights_key(weights)) if store else _scored(unique, score)
+        top = select_top(stream_json(raw_path, scored), config.max_items_per_section)
+        news, papers, oss = top["news"], top["papers"], top["oss"]
+
+        # Summarize only what made the cut
+        selected = news + papers + oss
+        if store:
+            store.summarize(selected, apply_cn_summary)
+            store.prune(max(config.days, config.store_retention_days))
+        else:
+            for it in selected:
+                apply_cn_summary(it)
+    finally:
+        if store:
+            store.close()
+
     # Final aggregated structure
     agg = {
         "date": date_str,
@@ -174,11 +237,14 @@ def run(config: HotlistConfig) -> Dict[str, Any]:
         "aggregated": agg_path,
         "report": report_path,
         "counts": {
-            "total": len(items),
+            "total": total,
             "news": len(news),
             "papers": len(papers),
             "oss_models": len(oss),
         },
+        "sources": sources,
+        "cache": dict(cache.stats),
+        "store": store.counts if store else None,
     }
 
 
@@ -187,9 +253,18 @@ if __name__ == "__main__":
     parser.add_argument("--days", type=int, default=DEFAULT_CONFIG.days, help="抓取时间窗口（天）")
     parser.add_argument("--allow", type=str, default=None, help="关键词白名单，逗号分隔")
     parser.add_argument("--deny", type=str, default=None, help="关键词黑名单，逗号分隔")
+    parser.add_argument("--word-boundaries", action="store_true", help="英文关键词按整词匹配")
+    parser.add_argument("--scoring-profile", type=str, default=DEFAULT_CONFIG.scoring_profile, choices=sorted(SCORING_PROFILES), help="打分权重方案")
     parser.add_argument("--max-per-section", type=int, default=DEFAULT_CONFIG.max_items_per_section)
     parser.add_argument("--output-data", type=str, default=None, help="数据输出目录")
     parser.add_argument("--output-reports", type=str, default=None, help="报告输出目录")
+    parser.add_argument("--source-timeout", type=float, default=DEFAULT_CONFIG.source_timeout, help="单个数据源超时（秒）")
+    parser.add_argument("--collect-timeout", type=float, default=DEFAULT_CONFIG.collect_timeout, help="抓取阶段总超时（秒）")
+    parser.add_argument("--near-dup-threshold", type=float, default=DEFAULT_CONFIG.near_dup_threshold, help="近似重复判定阈值（0 关闭）")
+    parser.add_argument("--cache-dir", type=str, default=None, help="HTTP 缓存目录")
+    parser.add_argument("--no-cache", action="store_true", help="不使用 HTTP 缓存，全部重新抓取")
+    parser.add_argument("--store", type=str, default=None, help="SQLite 条目库路径（默认 <数据目录>/ai_hotlist.sqlite3）")
+    parser.add_argument("--no-store", action="store_true", help="不使用条目库，全部重新打分与摘要")
 
     args = parser.parse_args()
 
@@ -197,7 +272,9 @@ if __name__ == "__main__":
         days=args.days,
         allowlist=[x.strip() for x in args.allow.split(",")] if args.allow else [],
         denylist=[x.strip() for x in args.deny.split(",")] if args.deny else [],
+        keyword_word_boundaries=args.word_boundaries,
         max_items_per_section=args.max_per_section,
+        scoring_profile=args.scoring_profile,
         output_dir_data=os.path.abspath(args.output_data) if args.output_data else DEFAULT_CONFIG.output_dir_data,
         output_dir_reports=os.path.abspath(args.output_reports) if args.output_reports else DEFAULT_CONFIG.output_dir_reports,
         rss_feeds=DEFAULT_CONFIG.rss_feeds,
@@ -205,6 +282,15 @@ if __name__ == "__main__":
         hf_models_endpoint=DEFAULT_CONFIG.hf_models_endpoint,
         hf_datasets_endpoint=DEFAULT_CONFIG.hf_datasets_endpoint,
         pwc_trending_url=DEFAULT_CONFIG.pwc_trending_url,
+        source_timeout=args.source_timeout,
+        collect_timeout=args.collect_timeout,
+        collect_workers=DEFAULT_CONFIG.collect_workers,
+        near_dup_threshold=args.near_dup_threshold,
+        use_cache=not args.no_cache,
+        cache_dir=os.path.abspath(args.cache_dir) if args.cache_dir else DEFAULT_CONFIG.cache_dir,
+        cache_ttls=DEFAULT_CONFIG.cache_ttls,
+        use_store=not args.no_store,
+        store_path=os.path.abspath(args.store) if args.store else None,
     )
 
     result = run(cfg)
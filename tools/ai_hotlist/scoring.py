@@ -1,38 +1,159 @@
-from typing import Any, Dict
+import copy
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
 from .utils import safe_float
 
 
-def score_item(item: Dict[str, Any]) -> float:
-    t = item.get("type")
-    m = item.get("metrics", {}) or {}
-    base = 0.0
-
-    if t == "news":
-        # Base on source weight and presence on multiple feeds
-        source_weight = safe_float(m.get("source_weight", 0))
-        share_count = safe_float(m.get("share_count", 0))
-        base = 10 + source_weight + 0.5 * share_count
-    elif t == "paper":
-        # Base on PWC trending, authors count
-        authors = safe_float(m.get("authors", 1))
-        pwc_trending = safe_float(m.get("pwc_trending_rank", 0))
-        base = 25 + min(10, authors / 2.0) + (10 if pwc_trending > 0 else 0) + max(0, 5 - pwc_trending)
-    elif t == "open-source":
-        # GitHub stars and trending rank
-        stars = safe_float(m.get("stars", 0))
-        new_stars = safe_float(m.get("new_stars", 0))
-        trending_rank = safe_float(m.get("trending_rank", 0))
-        base = 20 + (stars ** 0.5) + (new_stars ** 0.5) + max(0, 10 - trending_rank)
-    elif t == "model":
-        # HF downloads
-        downloads = safe_float(m.get("downloads_last_month", m.get("downloads", 0)))
-        likes = safe_float(m.get("likes", 0))
-        base = 20 + (downloads ** 0.5) + (likes ** 0.3)
-    else:
-        base = 10
-
-    # Recency boost
-    if item.get("date"):
-        base += 2
-
-    return round(base, 2)
+# Per type: "base" plus weighted metric terms (see BatchScorer._type_scores); "<metric>_exp"
+# is the exponent a count is raised to, "*_rank_bonus" is added minus the rank, and
+# "recency" is added to every item that has a date.
+DEFAULT_WEIGHTS: Dict[str, Any] = {
+    "news": {"base": 10.0, "source_weight": 1.0, "share_count": 0.5},
+    "paper": {"base": 25.0, "authors": 0.5, "authors_cap": 10.0, "pwc_trending": 10.0, "pwc_rank_bonus": 5.0},
+    "open-source": {
+        "base": 20.0,
+        "stars": 1.0,
+        "stars_exp": 0.5,
+        "new_stars": 1.0,
+        "new_stars_exp": 0.5,
+        "trending_rank_bonus": 10.0,
+    },
+    "model": {"base": 20.0, "downloads": 1.0, "downloads_exp": 0.5, "likes": 1.0, "likes_exp": 0.3},
+    "other": {"base": 10.0},
+    "recency": 2.0,
+}
+
+# Named overrides of DEFAULT_WEIGHTS.
+SCORING_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    # Rank papers and news up against repositories and models.
+    "research": {
+        "paper": {"base": 40.0, "pwc_trending": 20.0},
+        "news": {"base": 20.0},
+        "open-source": {"stars_exp": 0.4},
+        "model": {"downloads_exp": 0.4},
+    },
+    # Lean on community signals: stars, likes and downloads.
+    "community": {
+        "open-source": {"stars_exp": 0.6, "new_stars": 2.0},
+        "model": {"likes": 3.0, "likes_exp": 0.5},
+    },
+}
+
+
+def resolve_weights(profile: str = "default", overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """DEFAULT_WEIGHTS with a named profile and then ``overrides`` applied on top."""
+    weights = copy.deepcopy(DEFAULT_WEIGHTS)
+    if profile not in SCORING_PROFILES:
+        raise ValueError(f"unknown scoring profile {profile!r}; choose from {', '.join(SCORING_PROFILES)}")
+    for layer in (SCORING_PROFILES[profile], overrides or {}):
+        for key, value in layer.items():
+            if isinstance(value, dict):
+                weights.setdefault(key, {}).update(value)
+            else:
+                weights[key] = value
+    return weights
+
+
+def weights_key(weights: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(weights, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def _downloads(m: Dict[str, Any]) -> Any:
+    # downloads_last_month wins whenever the key is present, even if it is None.
+    return m["downloads_last_month"] if "downloads_last_month" in m else m.get("downloads", 0)
+
+
+# Metric columns per type: name -> how to read it from the metrics dict.
+_COLUMNS = {
+    "news": {
+        "source_weight": (lambda m: m.get("source_weight", 0)),
+        "share_count": (lambda m: m.get("share_count", 0)),
+    },
+    "paper": {
+        "authors": (lambda m: m.get("authors", 1)),
+        "pwc_trending_rank": (lambda m: m.get("pwc_trending_rank", 0)),
+    },
+    "open-source": {
+        "stars": (lambda m: m.get("stars", 0)),
+        "new_stars": (lambda m: m.get("new_stars", 0)),
+        "trending_rank": (lambda m: m.get("trending_rank", 0)),
+    },
+    "model": {
+        "downloads": _downloads,
+        "likes": (lambda m: m.get("likes", 0)),
+    },
+}
+
+
+def _power(values: np.ndarray, exp: float) -> np.ndarray:
+    return np.power(np.maximum(values, 0.0), exp)
+
+
+class BatchScorer:
+    """Scores a fixed list of items under any weights, vectorized per type.
+
+    The metrics are pulled out of the item dicts into one float64 column per
+    metric and type when the scorer is built; ``scores(weights)`` is then
+    pure NumPy, so the same items can be re-ranked under several weighting
+    profiles without touching the dicts again.
+    """
+
+    def __init__(self, items: Sequence[Dict[str, Any]]):
+        self.size = len(items)
+        self.dated = np.array([bool(it.get("date")) for it in items], dtype=bool)
+        by_type: Dict[str, List[int]] = {}
+        for i, it in enumerate(items):
+            t = it.get("type")
+            by_type.setdefault(t if t in _COLUMNS else "other", []).append(i)
+        self.indices = {t: np.array(ix, dtype=np.intp) for t, ix in by_type.items()}
+        self.columns: Dict[str, Dict[str, np.ndarray]] = {}
+        for t, ix in by_type.items():
+            metrics = [items[i].get("metrics", {}) or {} for i in ix]
+            self.columns[t] = {
+                name: np.array([safe_float(get(m)) for m in metrics], dtype=np.float64)
+                for name, get in _COLUMNS.get(t, {}).items()
+            }
+
+    def _type_scores(self, t: str, w: Dict[str, float]) -> np.ndarray:
+        c = self.columns[t]
+        n = len(self.indices[t])
+        score = np.full(n, w.get("base", 0.0))
+        if t == "news":
+            score += w["source_weight"] * c["source_weight"] + w["share_count"] * c["share_count"]
+        elif t == "paper":
+            rank = c["pwc_trending_rank"]
+            score += np.minimum(w["authors_cap"], w["authors"] * c["authors"])
+            score += np.where(rank > 0, w["pwc_trending"], 0.0)
+            score += np.maximum(0.0, w["pwc_rank_bonus"] - rank)
+        elif t == "open-source":
+            score += w["stars"] * _power(c["stars"], w["stars_exp"])
+            score += w["new_stars"] * _power(c["new_stars"], w["new_stars_exp"])
+            score += np.maximum(0.0, w["trending_rank_bonus"] - c["trending_rank"])
+        elif t == "model":
+            score += w["downloads"] * _power(c["downloads"], w["downloads_exp"])
+            score += w["likes"] * _power(c["likes"], w["likes_exp"])
+        return score
+
+    def scores(self, weights: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        weights = weights or DEFAULT_WEIGHTS
+        out = np.zeros(self.size, dtype=np.float64)
+        for t, ix in self.indices.items():
+            out[ix] = self._type_scores(t, weights[t])
+        out += np.where(self.dated, weights["recency"], 0.0)
+        return np.round(out, 2)
+
+
+def score_items(items: Sequence[Dict[str, Any]], weights: Optional[Dict[str, Any]] = None) -> List[float]:
+    """Scores of ``items`` under ``weights`` (DEFAULT_WEIGHTS if omitted), as plain floats."""
+    if not items:
+        return []
+    return BatchScorer(items).scores(weights).tolist()
+
+
+def score_item(item: Dict[str, Any], weights: Optional[Dict[str, Any]] = None) -> float:
+    return score_items([item], weights)[0]
@@ -0,0 +1,201 @@
+import hashlib
+import json
+import sqlite3
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .utils import chunked, normalize_url
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    url TEXT PRIMARY KEY,
+    type TEXT,
+    title TEXT,
+    source TEXT,
+    date TEXT,
+    summary TEXT,
+    metrics TEXT,
+    fingerprint TEXT NOT NULL,
+    score REAL,
+    weights_key TEXT,
+    one_liner_cn TEXT,
+    highlights_cn TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_last_seen ON items (last_seen);
+"""
+
+# SQLite's default limit on bound parameters is 999 on older builds.
+_LOOKUP_BATCH = 900
+
+
+def fingerprint(item: Dict[str, Any]) -> str:
+    """Hash of everything scoring and summarizing read from an item."""
+    fields = {k: item.get(k) for k in ("type", "title", "summary", "description", "source", "date", "metrics")}
+    return hashlib.sha1(json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+class ItemStore:
+    """SQLite store of scored and summarized items, keyed by normalized URL.
+
+    ``scored`` scores only items that are new or whose content or metrics
+    changed since they were stored, and ``summarize`` likewise summarizes
+    only new or changed items; unchanged items get their stored score and
+    summary back. Lookups go through the primary key and pruning through
+    the ``last_seen`` index.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.counts = {"new": 0, "changed": 0, "unchanged": 0}
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(items)")}
+        if "weights_key" not in columns:
+            # Stores written before scores depended on configurable weights.
+            self.conn.execute("ALTER TABLE items ADD COLUMN weights_key TEXT")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ItemStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _lookup(self, urls: List[str]) -> Dict[str, tuple]:
+        found: Dict[str, tuple] = {}
+        for start in range(0, len(urls), _LOOKUP_BATCH):
+            batch = urls[start : start + _LOOKUP_BATCH]
+            marks = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT url, fingerprint, score, one_liner_cn, highlights_cn, weights_key FROM items WHERE url IN ({marks})",
+                batch,
+            )
+            for url, fp, score, one_liner, highlights, weights in rows:
+                found[url] = (fp, score, one_liner, highlights, weights)
+        return found
+
+    def _key(self, item: Dict[str, Any], seen: set) -> str:
+        # The normalized URL, or "" for items with no URL or a URL already seen this run.
+        url = normalize_url(item.get("url") or "")
+        if not url or url in seen:
+            return ""
+        seen.add(url)
+        return url
+
+    def scored(
+        self,
+        items: Iterable[Dict[str, Any]],
+        score: Callable[[List[Dict[str, Any]]], List[float]],
+        weights_key: str = "",
+        batch: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield ``items`` with ``score`` set, reusing stored scores of unchanged items.
+
+        Items are looked up ``batch`` at a time by primary key, and
+        ``score(items)`` is called once per batch on the items that need
+        scoring: new or changed ones, and unchanged ones stored under other
+        weights (``weights_key``). New and changed items are upserted; a
+        change clears the stored summary, which ``summarize`` fills in again
+        if the item is selected. ``self.counts`` tallies new, changed and
+        unchanged items.
+        """
+        seen: set = set()
+        for chunk in chunked(items, batch):
+            keys = [self._key(it, seen) for it in chunk]
+            stored = self._lookup([k for k in keys if k])
+            now = time.time()
+            pending: List[Tuple[str, Dict[str, Any], Optional[tuple], str]] = []
+            touched: List[tuple] = []
+            for url, it in zip(keys, chunk):
+                row = stored.get(url) if url else None
+                fp = fingerprint(it)
+                if row and row[0] == fp:
+                    self.counts["unchanged"] += 1
+                    if row[4] == weights_key:
+                        it["score"] = row[1]
+                        touched.append((now, url))
+                        continue
+                else:
+                    self.counts["changed" if row else "new"] += 1
+                pending.append((url, it, row, fp))
+
+            upserts: List[tuple] = []
+            rescored: List[tuple] = []
+            for (url, it, row, fp), value in zip(pending, score([p[1] for p in pending]) if pending else []):
+                it["score"] = value
+                if not url:
+                    continue
+                if row and row[0] == fp:
+                    rescored.append((value, weights_key, now, url))
+                    continue
+                upserts.append(
+                    (
+                        url,
+                        it.get("type"),
+                        it.get("title"),
+                        it.get("source"),
+                        str(it["date"]) if it.get("date") else None,
+                        it.get("summary"),
+                        json.dumps(it.get("metrics") or {}, ensure_ascii=False, default=str),
+                        fp,
+                        value,
+                        weights_key,
+                        now,
+                        now,
+                    )
+                )
+            with self.conn:
+                self.conn.executemany(
+                    """
+                    INSERT INTO items (url, type, title, source, date, summary, metrics, fingerprint, score,
+                                       weights_key, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (url) DO UPDATE SET
+                        type = excluded.type, title = excluded.title, source = excluded.source,
+                        date = excluded.date, summary = excluded.summary, metrics = excluded.metrics,
+                        fingerprint = excluded.fingerprint, score = excluded.score,
+                        weights_key = excluded.weights_key,
+                        one_liner_cn = NULL, highlights_cn = NULL, last_seen = excluded.last_seen
+                    """,
+                    upserts,
+                )
+                self.conn.executemany(
+                    "UPDATE items SET score = ?, weights_key = ?, last_seen = ? WHERE url = ?", rescored
+                )
+                self.conn.executemany("UPDATE items SET last_seen = ? WHERE url = ?", touched)
+            yield from chunk
+
+    def summarize(self, items: List[Dict[str, Any]], summarize: Callable[[Dict[str, Any]], Any]) -> None:
+        """Fill in ``one_liner_cn``/``highlights_cn``, reusing stored summaries of unchanged items."""
+        keys = [self._key(it, set()) for it in items]
+        stored = self._lookup([k for k in keys if k])
+        updates: List[tuple] = []
+        for url, it in zip(keys, items):
+            row = stored.get(url) if url else None
+            # Only a row stored for this very content may be read or written.
+            current = bool(row) and row[0] == fingerprint(it)
+            if current and row[2] is not None:
+                it["one_liner_cn"] = row[2]
+                it["highlights_cn"] = json.loads(row[3] or "[]")
+                continue
+            summarize(it)
+            if current:
+                updates.append(
+                    (it.get("one_liner_cn"), json.dumps(it.get("highlights_cn") or [], ensure_ascii=False), url)
+                )
+        with self.conn:
+            self.conn.executemany("UPDATE items SET one_liner_cn = ?, highlights_cn = ? WHERE url = ?", updates)
+
+    def prune(self, older_than_days: float) -> int:
+        """Delete items no run has seen for ``older_than_days`` days."""
+        cutoff = time.time() - older_than_days * 86400
+        with self.conn:
+            return self.conn.execute("DELETE FROM items WHERE last_seen < ?", (cutoff,)).rowcount
+
@@ -1,12 +1,10 @@
 from typing import Any, Dict, List
-from .utils import simple_keywords
+from .text import text_view
 
 
 def cn_one_liner(item: Dict[str, Any]) -> str:
-    title = item.get("title") or ""
     t = item.get("type")
-    body = item.get("summary") or item.get("description") or ""
-    kw = simple_keywords(f"{title} {body}", top_k=3)
+    kw = text_view(item).keywords(top_k=3)
     kw_text = "、".join(kw) if kw else "AI"
 
     if t == "paper":
@@ -21,8 +19,7 @@ def cn_one_liner(item: Dict[str, Any]) -> str:
 def cn_highlights(item: Dict[str, Any]) -> List[str]:
     m = item.get("metrics", {}) or {}
     t = item.get("type")
-    title = item.get("title") or ""
-    kw = simple_keywords(title, top_k=3)
+    kw = text_view(item).title_keywords(top_k=3)
     kw_text = "、".join(kw) if kw else "AI"
 
     highlights: List[str] = []
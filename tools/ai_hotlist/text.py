@@ -0,0 +1,145 @@
+import functools
+import re
+import string
+from collections import Counter
+from typing import Any, Dict, List
+
+
+CHINESE_PUNCT = "，。；：？！“”‘’（）《》、——…"
+PUNCT = set(string.punctuation + CHINESE_PUNCT)
+
+# One pass maps every punctuation character to a space (faster than str.translate
+# once the text is not pure ASCII).
+_PUNCT_RE = re.compile("[" + re.escape("".join(sorted(PUNCT))) + "]")
+_WORD_SPLIT = re.compile(r"[^\w]+")
+
+STOP_WORDS = frozenset(
+    [
+        "the",
+        "and",
+        "with",
+        "this",
+        "that",
+        "for",
+        "into",
+        "from",
+        "are",
+        "was",
+        "were",
+        "have",
+        "has",
+        "had",
+        "using",
+        "use",
+        "of",
+        "in",
+        "on",
+        "to",
+        "a",
+        "an",
+        "by",
+        "we",
+        "our",
+        "is",
+        "it",
+        "as",
+        "at",
+        "be",
+        "can",
+        "via",
+        "based",
+        "model",
+        "models",
+        "paper",
+        "method",
+        "methods",
+    ]
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, punctuation to spaces, whitespace collapsed and stripped."""
+    return " ".join(_PUNCT_RE.sub(" ", (text or "").lower()).split())
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _is_keyword(token: str) -> bool:
+    # Tokens repeat heavily across items, so each distinct one is judged once.
+    if len(token) <= 1 or token in STOP_WORDS:
+        return False
+    return not (any(ch.isdigit() for ch in token) and not any(ch.isalpha() for ch in token))
+
+
+def keyword_counts(text: str) -> Counter:
+    return Counter(filter(_is_keyword, _WORD_SPLIT.split((text or "").lower())))
+
+
+def top_keywords(counts: Dict[str, int], top_k: int = 5) -> List[str]:
+    return [w for w, _ in sorted(counts.items(), key=lambda x: (-x[1], x[0]))[:top_k]]
+
+
+class TextView:
+    """Derived text of one title/summary pair, each part computed on first use.
+
+    ``text_view(item)`` hands every stage (keyword filter, dedup, near-dup,
+    summarizer) the same view for the same title and summary, so the text is
+    normalized and tokenized once per run instead of once per stage.
+    """
+
+    __slots__ = ("title", "summary", "_title_norm", "_norm", "_counts", "_title_counts")
+
+    def __init__(self, title: str, summary: str):
+        self.title = title
+        self.summary = summary
+        self._title_norm = None
+        self._norm = None
+        self._counts = None
+        self._title_counts = None
+
+    @property
+    def title_norm(self) -> str:
+        if self._title_norm is None:
+            self._title_norm = normalize_text(self.title)
+        return self._title_norm
+
+    @property
+    def norm(self) -> str:
+        """Normalized title and summary."""
+        if self._norm is None:
+            self._norm = normalize_text(f"{self.title} {self.summary}")
+        return self._norm
+
+    @property
+    def keyword_counts(self) -> Counter:
+        """Keyword counts of title and summary."""
+        if self._counts is None:
+            # Tokens never span the space between title and summary, so the counts add up.
+            self._counts = self.title_keyword_counts + keyword_counts(self.summary)
+        return self._counts
+
+    @property
+    def title_keyword_counts(self) -> Counter:
+        if self._title_counts is None:
+            self._title_counts = keyword_counts(self.title)
+        return self._title_counts
+
+    def keywords(self, top_k: int = 5) -> List[str]:
+        return top_keywords(self.keyword_counts, top_k)
+
+    def title_keywords(self, top_k: int = 5) -> List[str]:
+        return top_keywords(self.title_keyword_counts, top_k)
+
+
+@functools.lru_cache(maxsize=1 << 18)
+def _view(title: str, summary: str) -> TextView:
+    return TextView(title, summary)
+
+
+def text_view(item: Dict[str, Any]) -> TextView:
+    """The shared TextView of an item's title and summary (or description)."""
+    return _view(item.get("title") or "", item.get("summary") or item.get("description") or "")
+
+
+def clear_views() -> None:
+    _view.cache_clear()
+
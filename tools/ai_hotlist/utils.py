@@ -1,18 +1,18 @@
 import os
-import re
 import json
 import math
 import time
-import string
+import itertools
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pytz
 from dateutil import parser as dateparser
 
-
-CHINESE_PUNCT = "，。；：？！“”‘’（）《》、——…"
-PUNCT = set(string.punctuation + CHINESE_PUNCT)
+from .text import CHINESE_PUNCT, PUNCT, keyword_counts, normalize_text, top_keywords
 
 
 def ensure_dirs(*paths: str) -> None:
@@ -50,71 +50,9 @@ def within_days(dt: Optional[datetime], days: int) -> bool:
     return dt >= days_ago(days)
 
 
-def normalize_text(text: str) -> str:
-    text = (text or "").strip().lower()
-    text = re.sub(r"\s+", " ", text)
-    for ch in PUNCT:
-        text = text.replace(ch, " ")
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
 def simple_keywords(text: str, top_k: int = 5) -> List[str]:
-    text = (text or "").lower()
     # Split by non-word, keep ascii words/numbers; Chinese not handled perfectly
-    tokens = re.split(r"[^\w]+", text)
-    stop = set(
-        [
-            "the",
-            "and",
-            "with",
-            "this",
-            "that",
-            "for",
-            "into",
-            "from",
-            "are",
-            "was",
-            "were",
-            "have",
-            "has",
-            "had",
-            "using",
-            "use",
-            "of",
-            "in",
-            "on",
-            "to",
-            "a",
-            "an",
-            "by",
-            "we",
-            "our",
-            "is",
-            "it",
-            "as",
-            "at",
-            "be",
-            "can",
-            "via",
-            "based",
-            "model",
-            "models",
-            "paper",
-            "method",
-            "methods",
-        ]
-    )
-    counts: Dict[str, int] = {}
-    for t in tokens:
-        if not t or len(t) <= 1:
-            continue
-        if t in stop:
-            continue
-        if any(ch.isdigit() for ch in t) and not any(ch.isalpha() for ch in t):
-            continue
-        counts[t] = counts.get(t, 0) + 1
-    return [w for w, _ in sorted(counts.items(), key=lambda x: (-x[1], x[0]))[:top_k]]
+    return top_keywords(keyword_counts(text), top_k)
 
 
 def dump_json(path: str, data: Any) -> None:
@@ -122,6 +60,27 @@ def dump_json(path: str, data: Any) -> None:
         json.dump(data, f, ensure_ascii=False, indent=2, default=str)
 
 
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(items)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_json(path: str, items: Iterable[Any]) -> Iterator[Any]:
+    """Pass ``items`` through while writing them to ``path`` as a JSON array, like ``dump_json``."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        sep = "\n  "
+        for item in items:
+            f.write(sep + json.dumps(item, ensure_ascii=False, indent=2, default=str).replace("\n", "\n  "))
+            sep = ",\n  "
+            yield item
+        f.write("\n]" if sep != "\n  " else "]")
+
+
 def read_env(name: str, default: Optional[str] = None) -> Optional[str]:
     return os.environ.get(name, default)
 
@@ -182,3 +141,102 @@ def format_date(dt: Optional[datetime]) -> str:
     if not dt:
         return ""
     return dt.astimezone(pytz.timezone("UTC")).strftime("%Y-%m-%d")
+
+
+class Partial(list):
+    """A task result that is incomplete: the items collected so far and what stopped the rest.
+
+    ``run_concurrently`` reports a Partial with errors as ``"partial"``
+    instead of ``"ok"``, so a source that lost pages still hands over what
+    it has but shows up in the status.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), errors: Optional[List[str]] = None):
+        super().__init__(items)
+        self.errors = list(errors or [])
+
+
+def _work(jobs: "queue.SimpleQueue[Optional[Tuple[Future, Callable[[], Any]]]]") -> None:
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        fut, fn = job
+        if not fut.set_running_or_notify_cancel():
+            continue
+        try:
+            fut.set_result(fn())
+        except BaseException as e:
+            fut.set_exception(e)
+
+
+def run_concurrently(
+    tasks: Dict[str, Callable[[], Any]],
+    task_timeout: Union[None, float, Dict[str, float]] = None,
+    total_timeout: Optional[float] = None,
+    max_workers: int = 8,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Run tasks on a pool of daemon threads and keep whatever finishes in time.
+
+    Deadlines count from the call: each task gets ``task_timeout`` seconds
+    (a number, or a per-name dict) and the whole batch ``total_timeout``
+    seconds. Tasks not yet started at their deadline never start; tasks
+    still running are abandoned. Their threads are daemons, so they do not
+    keep the process alive once the caller is done (unlike
+    ThreadPoolExecutor, whose workers are joined at exit). Tasks that raise
+    are dropped. Returns the results by name and a status entry per task:
+    ``{"status": "ok" | "partial" | "error" | "timeout", "seconds": ...}``,
+    with ``"error"`` set for failed tasks and for ``Partial`` results.
+    """
+    results: Dict[str, Any] = {}
+    status: Dict[str, Dict[str, Any]] = {}
+    if not tasks:
+        return results, status
+
+    started = time.monotonic()
+    deadlines: Dict[str, float] = {}
+    for name in tasks:
+        limit = task_timeout.get(name) if isinstance(task_timeout, dict) else task_timeout
+        candidates = [t for t in (limit, total_timeout) if t]
+        deadlines[name] = started + min(candidates) if candidates else math.inf
+
+    jobs: "queue.SimpleQueue[Optional[Tuple[Future, Callable[[], Any]]]]" = queue.SimpleQueue()
+    futures: Dict[Future, str] = {}
+    for name, fn in tasks.items():
+        fut: Future = Future()
+        futures[fut] = name
+        jobs.put((fut, fn))
+    workers = max(1, min(max_workers, len(tasks)))
+    for _ in range(workers):
+        jobs.put(None)
+        threading.Thread(target=_work, args=(jobs,), name="run_concurrently", daemon=True).start()
+
+    pending = set(futures)
+    try:
+        while pending:
+            now = time.monotonic()
+            expired = {f for f in pending if deadlines[futures[f]] <= now}
+            for fut in expired:
+                fut.cancel()
+                status[futures[fut]] = {"status": "timeout", "seconds": round(now - started, 3)}
+            pending -= expired
+            if not pending:
+                break
+            next_deadline = min(deadlines[futures[f]] for f in pending)
+            timeout = None if next_deadline == math.inf else max(0.0, next_deadline - now)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = futures[fut]
+                seconds = round(time.monotonic() - started, 3)
+                try:
+                    result = results[name] = fut.result()
+                    if isinstance(result, Partial) and result.errors:
+                        status[name] = {"status": "partial", "seconds": seconds, "error": "; ".join(result.errors)}
+                    else:
+                        status[name] = {"status": "ok", "seconds": seconds}
+                except Exception as e:
+                    status[name] = {"status": "error", "seconds": seconds, "error": str(e)}
+    finally:
+        for fut in pending:
+            fut.cancel()
+    return results, status